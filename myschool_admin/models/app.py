@@ -11,6 +11,6 @@ class MySchoolAdminApp(models.Model):
         """
         Button action to trigger the service procedure
         """
-        informat_service = self.env['myschool.InformatService']
-        result = informat_service.execute_sync(dev_mode = True)
+        informat_service = self.env['myschool.informat.service']
+        result = informat_service.execute_sync()
         return result
\ No newline at end of file
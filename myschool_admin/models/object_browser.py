@@ -230,13 +230,10 @@ class ObjectBrowser(models.TransientModel):
             person_count = len(persons)
         
         # Get CI relations count
-        ci_count = 0
-        if 'myschool.ci.relation' in self.env:
-            CiRelation = self.env['myschool.ci.relation']
-            ci_count = CiRelation.search_count([
-                ('id_org', '=', org.id),
-                ('isactive', '=', True)
-            ])
+        ci_count = self.env['myschool.ci.relation'].search_count([
+            ('id_org', '=', org.id),
+            ('isactive', '=', True)
+        ])
         
         is_administrative = org.is_administrative if hasattr(org, 'is_administrative') else False
         
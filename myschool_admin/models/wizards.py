@@ -1082,59 +1082,59 @@ class AddChildOrgWizard(models.TransientModel):
         if not self.parent_org_id:
             return None
         
-        # Check if CI models exist
-        if 'myschool.config.item' not in self.env:
-            return None
-        
         ConfigItem = self.env['myschool.config.item']
         
-        # Try to get via ConfigItem's method if available
-        if hasattr(ConfigItem, 'get_ci_value_by_org_and_name'):
-            parent_short = self.parent_org_id.name_short if hasattr(self.parent_org_id, 'name_short') else self.parent_org_id.name
-            value = ConfigItem.get_ci_value_by_org_and_name(parent_short, 'OuForGroups')
-            if value:
-                return value
+        # Try to get via ConfigItem's method
+        value = ConfigItem.get_ci_value_by_org_and_name(self.parent_org_id.name_short, 'OuForGroups')
+        if value:
+            return value
         
         # Fallback: search directly in CiRelation
-        if 'myschool.ci.relation' in self.env:
-            CiRelation = self.env['myschool.ci.relation']
-            PropRelationType = self.env['myschool.proprelation.type']
+        CiRelation = self.env['myschool.ci.relation']
+        PropRelationType = self.env['myschool.proprelation.type']
 
-            # Get ORG-TREE type
-            org_tree_type = PropRelationType.search([('name', '=', 'ORG-TREE')], limit=1)
+        # Get ORG-TREE type
+        org_tree_type = PropRelationType.search([('name', '=', 'ORG-TREE')], limit=1)
 
-            # Walk up the org hierarchy to find the CI (only via ORG-TREE relations)
-            current_org = self.parent_org_id
-            visited = set()
+        # Resolve the config item ids once instead of joining on the name per org
+        ci_values = {
+            row['id']: row['string_value']
+            for row in ConfigItem.search_read(
+                [('name', '=', 'OuForGroups')], ['string_value'])
+        }
 
-            while current_org and current_org.id not in visited:
-                visited.add(current_org.id)
+        # Walk up the org hierarchy to find the CI (only via ORG-TREE relations)
+        current_org = self.parent_org_id
+        visited = set()
 
-                # Search for OuForGroups CI linked to this org
-                ci_relation = CiRelation.search([
-                    ('id_org', '=', current_org.id),
-                    ('id_ci.name', '=', 'OuForGroups'),
-                    ('isactive', '=', True)
-                ], limit=1)
+        while current_org and current_org.id not in visited:
+            visited.add(current_org.id)
 
-                if ci_relation and ci_relation.id_ci and ci_relation.id_ci.string_value:
-                    return ci_relation.id_ci.string_value
+            # Search for OuForGroups CI linked to this org
+            ci_relation = CiRelation.search_read([
+                ('id_org', '=', current_org.id),
+                ('id_ci', 'in', list(ci_values)),
+                ('isactive', '=', True)
+            ], ['id_ci'], limit=1, load=None)
 
-                # Move to parent org via ORG-TREE relation only
-                try:
-                    PropRelation = self.env['myschool.proprelation']
-                    search_domain = [
-                        ('id_org', '=', current_org.id),
-                        ('id_org_parent', '!=', False),
-                        ('is_active', '=', True),
-                    ]
-                    if org_tree_type:
-                        search_domain.append(('proprelation_type_id', '=', org_tree_type.id))
+            if ci_relation and ci_values.get(ci_relation[0]['id_ci']):
+                return ci_values[ci_relation[0]['id_ci']]
 
-                    parent_rel = PropRelation.search(search_domain, limit=1)
-                    current_org = parent_rel.id_org_parent if parent_rel else None
-                except KeyError:
-                    break
+            # Move to parent org via ORG-TREE relation only
+            try:
+                PropRelation = self.env['myschool.proprelation']
+                search_domain = [
+                    ('id_org', '=', current_org.id),
+                    ('id_org_parent', '!=', False),
+                    ('is_active', '=', True),
+                ]
+                if org_tree_type:
+                    search_domain.append(('proprelation_type_id', '=', org_tree_type.id))
+
+                parent_rel = PropRelation.search(search_domain, limit=1)
+                current_org = parent_rel.id_org_parent if parent_rel else None
+            except KeyError:
+                break
 
         return None
     
@@ -1,6 +1,6 @@
 {
     'name': 'MySchool Core Module',
-    'version': '0.1',
+    'version': '0.2',
     'category': 'MySchool',
     'summary': 'Manage school organizations, persons, roles, and periods',
     'description': """
@@ -0,0 +1,35 @@
+"""Prepare the CI relations for the unique index on their active context.
+
+Of every set of active relations sharing the same context only the most
+recently written one stays active, so the index can be built. The ids of
+the deactivated relations are logged for review.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    cr.execute("""
+        UPDATE myschool_ci_relation rel
+           SET isactive = FALSE
+          FROM (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY id_ci, COALESCE(id_org, 0), COALESCE(id_person, 0),
+                                        COALESCE(id_role, 0), COALESCE(id_period, 0)
+                           ORDER BY write_date DESC NULLS LAST, id DESC
+                       ) AS position
+                  FROM myschool_ci_relation
+                 WHERE isactive
+          ) AS duplicate
+         WHERE duplicate.id = rel.id
+           AND duplicate.position > 1
+     RETURNING rel.id
+    """)
+    deactivated_ids = sorted(row[0] for row in cr.fetchall())
+    if deactivated_ids:
+        _logger.warning(
+            "Deactivated %s duplicate active CI relations: %s",
+            len(deactivated_ids), deactivated_ids,
+        )
@@ -68,6 +68,7 @@ class BeTask(models.Model):
     
     data = fields.Text(
         string='Data',
+        index='trigram',  # substring (ilike) searches in find_by_data_and_status
         help='Primary data for task processing (usually JSON)'
     )
     
@@ -201,6 +202,9 @@ class BeTask(models.Model):
         compute='_compute_color'
     )
     
+    # Serves the type + status lookups of the task service (find_by_type_and_status, find_pending)
+    _betasktype_status_idx = models.Index('(betasktype_id, status)')
+    
     @api.depends('status', 'automatic_sync', 'retry_count', 'max_retries')
     def _compute_is_processable(self):
         for record in self:
@@ -30,24 +30,54 @@ The processor can be triggered by:
 - API call
 """
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, UserError
 import logging
 import json
 import random
+import re
 import string
 import time
 import traceback
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Optional, Any, List
 
 _logger = logging.getLogger(__name__)
 
+# Characters allowed in generated logins
+_LOGIN_SANITIZE_RE = re.compile(r'[^a-z0-9.]')
+
 
 # =============================================================================
 # PROPRELATION NAME BUILDER FUNCTION
 # =============================================================================
 
+# Field mapping: field_name -> (abbreviation, primary_field, fallback_field)
+PROPRELATION_NAME_FIELD_MAP = {
+    'id_org': ('Or', 'name_tree', 'name'),
+    'id_org_parent': ('OrP', 'name_tree', 'name'),
+    'id_org_child': ('OrC', 'name_tree', 'name'),
+    'id_period': ('Pd', 'name', 'name'),
+    'id_period_parent': ('PdP', 'name', 'name'),
+    'id_period_child': ('PdC', 'name', 'name'),
+    'id_role': ('Ro', 'name', 'name'),
+    'id_role_parent': ('RoP', 'name', 'name'),
+    'id_role_child': ('RoC', 'name', 'name'),
+    'id_person': ('Pn', 'name', 'name'),
+    'id_person_parent': ('PnP', 'name', 'name'),
+    'id_person_child': ('PnC', 'name', 'name'),
+}
+
+# Order of fields in the name (for consistent output)
+PROPRELATION_NAME_FIELD_ORDER = [
+    'id_role', 'id_role_parent', 'id_role_child',
+    'id_org_parent', 'id_org', 'id_org_child',
+    'id_person', 'id_person_parent', 'id_person_child',
+    'id_period', 'id_period_parent', 'id_period_child',
+]
+
+
 def build_proprelation_name(proprelation_type_name: str, **kwargs) -> str:
     """
     Build a standardized proprelation name.
@@ -71,45 +101,23 @@ def build_proprelation_name(proprelation_type_name: str, **kwargs) -> str:
     
     Args:
         proprelation_type_name: The type name (e.g., 'BRSO', 'ORG-TREE', 'PERSON-TREE')
-        **kwargs: Field values as records
+        **kwargs: Field values as records, or as already resolved name strings
     
     Returns:
         String like 'PPSBR:Ro=EMPLOYEE,Or=int.olvp.bawa,Pn=Demeyer'
     """
-    # Field mapping: field_name -> (abbreviation, primary_field, fallback_field)
-    field_map = {
-        'id_org': ('Or', 'name_tree', 'name'),
-        'id_org_parent': ('OrP', 'name_tree', 'name'),
-        'id_org_child': ('OrC', 'name_tree', 'name'),
-        'id_period': ('Pd', 'name', 'name'),
-        'id_period_parent': ('PdP', 'name', 'name'),
-        'id_period_child': ('PdC', 'name', 'name'),
-        'id_role': ('Ro', 'name', 'name'),
-        'id_role_parent': ('RoP', 'name', 'name'),
-        'id_role_child': ('RoC', 'name', 'name'),
-        'id_person': ('Pn', 'name', 'name'),
-        'id_person_parent': ('PnP', 'name', 'name'),
-        'id_person_child': ('PnC', 'name', 'name'),
-    }
-    
-    # Order of fields in the name (for consistent output)
-    field_order = [
-        'id_role', 'id_role_parent', 'id_role_child',
-        'id_org_parent', 'id_org', 'id_org_child',
-        'id_person', 'id_person_parent', 'id_person_child',
-        'id_period', 'id_period_parent', 'id_period_child',
-    ]
-    
     parts = []
     
-    for field_name in field_order:
+    for field_name in PROPRELATION_NAME_FIELD_ORDER:
         if field_name in kwargs and kwargs[field_name]:
             record = kwargs[field_name]
-            abbr, primary_field, fallback_field = field_map[field_name]
+            abbr, primary_field, fallback_field = PROPRELATION_NAME_FIELD_MAP[field_name]
             
-            # Get value from record
+            # Get value from record (or use the pre-resolved string)
             value = None
-            if hasattr(record, primary_field) and getattr(record, primary_field):
+            if isinstance(record, str):
+                value = record
+            elif hasattr(record, primary_field) and getattr(record, primary_field):
                 value = getattr(record, primary_field)
             elif hasattr(record, fallback_field) and getattr(record, fallback_field):
                 value = getattr(record, fallback_field)
@@ -4347,7 +4355,7 @@ class BeTaskProcessor(models.AbstractModel):
             "role_name": "ict-coordinator"
         }
         """
-        _logger.info(f'Processing ODOO_GROUPMEMBER_ADD: {task.name}')
+        _logger.info('Processing ODOO_GROUPMEMBER_ADD: %s', task.name)
         
         data = self._parse_task_data(task.data)
         if not data:
@@ -4387,13 +4395,13 @@ class BeTaskProcessor(models.AbstractModel):
                 return False
             
             # Check if user already in group
-            if group in user.group_ids:
-                _logger.info(f'User {user.login} already in group {group.full_name}')
+            if group.id in user.group_ids.ids:
+                _logger.info('User %s already in group %s', user.login, group.full_name)
                 return True
             
             # Add user to group
             user.write({'group_ids': [(4, group.id)]})
-            _logger.info(f'Added user {user.login} to group {group.full_name}')
+            _logger.info('Added user %s to group %s', user.login, group.full_name)
             
             return True
             
@@ -4415,7 +4423,7 @@ class BeTaskProcessor(models.AbstractModel):
             "reason": "Role removed"
         }
         """
-        _logger.info(f'Processing ODOO_GROUPMEMBER_REMOVE: {task.name}')
+        _logger.info('Processing ODOO_GROUPMEMBER_REMOVE: %s', task.name)
         
         data = self._parse_task_data(task.data)
         if not data:
@@ -4440,7 +4448,7 @@ class BeTaskProcessor(models.AbstractModel):
                     user = person.odoo_user_id
             
             if not user or not user.exists():
-                _logger.warning(f'User not found for GROUPMEMBER REMOVE - may already be deleted')
+                _logger.warning('User not found for GROUPMEMBER REMOVE - may already be deleted')
                 return True
             
             # Get group
@@ -4451,18 +4459,18 @@ class BeTaskProcessor(models.AbstractModel):
             
             group = ResGroups.browse(group_id)
             if not group or not group.exists():
-                _logger.warning(f'Group {group_id} not found - may already be deleted')
+                _logger.warning('Group %s not found - may already be deleted', group_id)
                 return True
             
             # Check if user in group
-            if group not in user.group_ids:
-                _logger.info(f'User {user.login} not in group {group.full_name}')
+            if group.id not in user.group_ids.ids:
+                _logger.info('User %s not in group %s', user.login, group.full_name)
                 return True
             
             # Remove user from group
             reason = data.get('reason', 'Removed by sync')
             user.write({'group_ids': [(3, group.id)]})
-            _logger.info(f'Removed user {user.login} from group {group.full_name}, reason: {reason}')
+            _logger.info('Removed user %s from group %s, reason: %s', user.login, group.full_name, reason)
             
             return True
             
@@ -4481,8 +4489,6 @@ class BeTaskProcessor(models.AbstractModel):
         @param person: myschool.person record
         @return: Generated login string
         """
-        import re
-        
         # Try email first
         if person.email_cloud:
             return person.email_cloud
@@ -4492,11 +4498,11 @@ class BeTaskProcessor(models.AbstractModel):
         
         # Generate from name
         first_name = person.first_name or ''
-        last_name = person.name.split(',')[0].strip() if ',' in person.name else person.name
+        last_name = person.name.partition(',')[0].strip() if ',' in person.name else person.name
         
         if first_name and last_name:
             login = f"{first_name.lower()}.{last_name.lower()}"
-            login = re.sub(r'[^a-z0-9.]', '', login)
+            login = _LOGIN_SANITIZE_RE.sub('', login)
             return login
         
         # Fallback to abbreviation or sap_ref
@@ -4518,15 +4524,30 @@ class BeTaskProcessor(models.AbstractModel):
         
         @param person: myschool.person record
         """
-        if not person.odoo_user_id:
-            _logger.debug(f'[GROUP-SYNC] Person {person.name} has no Odoo user - skipping group sync')
-            return
+        self._sync_person_group_memberships_multi(person)
+
+    def _sync_person_group_memberships_multi(self, persons):
+        """
+        Synchronize Odoo group memberships for several persons at once.
+        
+        Same behaviour as _sync_person_group_memberships, but the PPSBR type,
+        the managed roles and the active PPSBR PropRelations are fetched once
+        for all persons, and the resulting ADD and REMOVE BeTasks are created
+        in a single create() call.
         
-        _logger.info(f'[GROUP-SYNC] Syncing group memberships for {person.name}')
+        @param persons: myschool.person recordset
+        """
+        debug = _logger.isEnabledFor(logging.DEBUG)
+        
+        if debug:
+            for person in persons.filtered(lambda p: not p.odoo_user_id):
+                _logger.debug('[GROUP-SYNC] Person %s has no Odoo user - skipping group sync', person.name)
+        persons = persons.filtered('odoo_user_id')
+        if not persons:
+            return
         
         PropRelation = self.env['myschool.proprelation']
         PropRelationType = self.env['myschool.proprelation.type']
-        Role = self.env['myschool.role']
         
         # Get PPSBR type
         ppsbr_type = PropRelationType.search([
@@ -4537,76 +4558,122 @@ class BeTaskProcessor(models.AbstractModel):
             _logger.warning('[GROUP-SYNC] PPSBR PropRelationType not found')
             return
         
-        # Get all active PPSBR for this person
-        active_ppsbr = PropRelation.search([
-            ('id_person', '=', person.id),
+        # Get the role ids of all active PPSBR for these persons, grouped per person.
+        # read(load=None) returns plain ids, so no recordsets are materialized.
+        all_ppsbr = PropRelation.search([
+            ('id_person', 'in', persons.ids),
             ('proprelation_type_id', '=', ppsbr_type.id),
             ('is_active', '=', True),
             ('id_role', '!=', False)
         ])
+        role_ids_by_person = defaultdict(set)
+        for row in all_ppsbr.read(['id_person', 'id_role'], load=None):
+            role_ids_by_person[row['id_person']].add(row['id_role'])
         
-        # Collect roles with Odoo groups
-        current_group_ids = set()
+        # Get all roles that have Odoo groups (to know which groups are managed)
+        group_id_by_role = dict(self._get_managed_role_groups())
+        managed_group_ids = set(group_id_by_role.values())
         
-        for ppsbr in active_ppsbr:
-            role = ppsbr.id_role
-            if role and hasattr(role, 'has_odoo_group') and role.has_odoo_group and role.odoo_group_id:
-                current_group_ids.add(role.odoo_group_id.id)
-                _logger.debug(f'[GROUP-SYNC] Role {role.name} has group: {role.odoo_group_id.full_name}')
+        # Per person: (person, user, groups_to_add, groups_to_remove)
+        changes = []
         
-        # Get all roles that have Odoo groups (to know which groups are managed)
-        managed_roles = Role.search([
-            ('has_odoo_group', '=', True),
-            ('odoo_group_id', '!=', False)
-        ])
-        managed_group_ids = set(managed_roles.mapped('odoo_group_id').ids)
+        for person in persons:
+            role_ids = role_ids_by_person[person.id]
+            
+            # Current user groups (only consider managed groups)
+            user = person.odoo_user_id
+            user_group_ids = set(user.group_ids.ids)
+            user_managed_groups = user_group_ids & managed_group_ids
+            
+            # Nothing to add and nothing to remove: skip the rest of the sync
+            if not role_ids and not user_managed_groups:
+                if debug:
+                    _logger.debug('[GROUP-SYNC] No roles and no managed groups for %s - nothing to sync', person.name)
+                continue
+            
+            # Collect groups of the roles with Odoo groups
+            current_group_ids = {
+                group_id_by_role[role_id] for role_id in role_ids if role_id in group_id_by_role
+            }
+            
+            if debug:
+                _logger.debug('[GROUP-SYNC] %s: current managed groups: %s, should have groups: %s',
+                              person.name, user_managed_groups, current_group_ids)
+            
+            # Groups to add
+            groups_to_add = current_group_ids - user_managed_groups
+            
+            # Groups to remove
+            groups_to_remove = user_managed_groups - current_group_ids
+            
+            if groups_to_add or groups_to_remove:
+                changes.append((person, user, groups_to_add, groups_to_remove))
         
-        # Current user groups (only consider managed groups)
-        user = person.odoo_user_id
-        user_group_ids = set(user.group_ids.ids)
-        user_managed_groups = user_group_ids & managed_group_ids
+        if not changes:
+            return
         
-        _logger.debug(f'[GROUP-SYNC] Current managed groups: {user_managed_groups}')
-        _logger.debug(f'[GROUP-SYNC] Should have groups: {current_group_ids}')
+        # Warm the prefetch cache for full_name of every group touched below
+        touched_group_ids = set()
+        for _person, _user, groups_to_add, groups_to_remove in changes:
+            touched_group_ids |= groups_to_add | groups_to_remove
+        all_groups = self.env['res.groups'].browse(list(touched_group_ids))
+        all_groups.mapped('full_name')
         
-        # Groups to add
-        groups_to_add = current_group_ids - user_managed_groups
+        # One timestamp for all task names created by this sync
+        now = fields.Datetime.now()
         
-        # Groups to remove
-        groups_to_remove = user_managed_groups - current_group_ids
+        # action -> list of task data, created together in one call
+        task_data = defaultdict(list)
         
-        # Create tasks for additions
-        for group_id in groups_to_add:
-            group = self.env['res.groups'].browse(group_id)
-            task_data = {
-                'person_id': person.id,
-                'user_id': user.id,
-                'group_id': group_id,
-                'group_name': group.full_name,
-            }
-            self._create_betask_internal(
-                'ODOO', 'GROUPMEMBER', 'ADD',
-                json.dumps(task_data),
-                None
-            )
-            _logger.info(f'[GROUP-SYNC] Created ADD task: {person.name} -> {group.full_name}')
+        for person, user, groups_to_add, groups_to_remove in changes:
+            added_names = []
+            removed_names = []
+            
+            # Tasks for additions
+            for group_id in groups_to_add:
+                group_name = all_groups.browse(group_id).full_name
+                added_names.append(group_name)
+                task_data['ADD'].append(json.dumps({
+                    'person_id': person.id,
+                    'user_id': user.id,
+                    'group_id': group_id,
+                    'group_name': group_name,
+                }))
+            
+            # Tasks for removals
+            for group_id in groups_to_remove:
+                group_name = all_groups.browse(group_id).full_name
+                removed_names.append(group_name)
+                task_data['REMOVE'].append(json.dumps({
+                    'person_id': person.id,
+                    'user_id': user.id,
+                    'group_id': group_id,
+                    'group_name': group_name,
+                    'reason': 'Role no longer active'
+                }))
+            
+            _logger.info('[GROUP-SYNC] %s: +%s -%s', person.name, added_names, removed_names)
         
-        # Create tasks for removals
-        for group_id in groups_to_remove:
-            group = self.env['res.groups'].browse(group_id)
-            task_data = {
-                'person_id': person.id,
-                'user_id': user.id,
-                'group_id': group_id,
-                'group_name': group.full_name,
-                'reason': 'Role no longer active'
-            }
-            self._create_betask_internal(
-                'ODOO', 'GROUPMEMBER', 'REMOVE',
-                json.dumps(task_data),
-                None
-            )
-            _logger.info(f'[GROUP-SYNC] Created REMOVE task: {person.name} <- {group.full_name}')
+        self._create_betasks_internal('ODOO', 'GROUPMEMBER', task_data, _now=now)
+
+    @tools.ormcache()
+    def _get_managed_role_groups(self):
+        """
+        Get the (role_id, odoo_group_id) pairs of all roles that manage an Odoo group.
+        
+        Cached; myschool.role clears the cache when a role is created, deleted
+        or its Odoo group settings change.
+        
+        @return: Tuple of (role_id, group_id) tuples
+        """
+        managed_roles = self.env['myschool.role'].sudo().search([
+            ('has_odoo_group', '=', True),
+            ('odoo_group_id', '!=', False)
+        ])
+        return tuple(
+            (row['id'], row['odoo_group_id'])
+            for row in managed_roles.read(['odoo_group_id'], load=None)
+        )
 
     def _remove_user_from_all_role_groups(self, user):
         """
@@ -4615,23 +4682,17 @@ class BeTaskProcessor(models.AbstractModel):
         
         @param user: res.users record
         """
-        Role = self.env['myschool.role']
-        
         # Get all managed groups
-        managed_roles = Role.search([
-            ('has_odoo_group', '=', True),
-            ('odoo_group_id', '!=', False)
-        ])
-        
-        managed_group_ids = managed_roles.mapped('odoo_group_id').ids
+        managed_group_ids = {group_id for _role_id, group_id in self._get_managed_role_groups()}
         
         # Remove user from all managed groups
         for group_id in managed_group_ids:
             if group_id in user.group_ids.ids:
                 user.write({'group_ids': [(3, group_id)]})
-                _logger.info(f'Removed user {user.login} from group ID {group_id}')
+                _logger.info('Removed user %s from group ID %s', user.login, group_id)
 
-    def _create_betask_internal(self, target: str, obj: str, action: str, data: str, data2: str = None):
+    def _create_betask_internal(self, target: str, obj: str, action: str, data: str, data2: str = None,
+                                _now=None):
         """
         Internal method to create a BeTask.
         
@@ -4640,6 +4701,7 @@ class BeTaskProcessor(models.AbstractModel):
         @param action: Task action (ADD, UPD, DEACT, REMOVE, etc.)
         @param data: JSON string with task data
         @param data2: Optional JSON string with additional data
+        @param _now: Optional timestamp for the task name (shared by callers creating several tasks)
         @return: Created BeTask record or None
         """
         BeTask = self.env['myschool.betask']
@@ -4652,11 +4714,11 @@ class BeTaskProcessor(models.AbstractModel):
         ], limit=1)
         
         if not task_type:
-            _logger.warning(f'BeTaskType not found: {target}-{obj}-{action}')
+            _logger.warning('BeTaskType not found: %s-%s-%s', target, obj, action)
             return None
         
         task_vals = {
-            'name': f'{target}-{obj}-{action}-{fields.Datetime.now()}',
+            'name': f'{target}-{obj}-{action}-{_now or fields.Datetime.now()}',
             'betasktype_id': task_type.id,
             'status': 'new',
             'data': data,
@@ -4665,6 +4727,49 @@ class BeTaskProcessor(models.AbstractModel):
         
         return BeTask.create(task_vals)
 
+    def _create_betasks_internal(self, target: str, obj: str, data_by_action: dict, _now=None):
+        """
+        Internal method to create BeTasks for one target/object in a single create() call.
+        
+        The task types of all requested actions are fetched with one search.
+        
+        @param target: Task target (DB, ODOO, LDAP, etc.)
+        @param obj: Task object (PERSON, GROUPMEMBER, etc.)
+        @param data_by_action: Dict action -> list of JSON strings, one per task
+        @param _now: Optional timestamp for the task names
+        @return: Created BeTask recordset or None
+        """
+        BeTask = self.env['myschool.betask']
+        BeTaskType = self.env['myschool.betask.type']
+        
+        task_types = BeTaskType.search([
+            ('target', '=', target),
+            ('object', '=', obj),
+            ('action', 'in', list(data_by_action))
+        ])
+        type_by_action = {}
+        for task_type in task_types:
+            type_by_action.setdefault(task_type.action, task_type)
+        
+        now = _now or fields.Datetime.now()
+        vals_list = []
+        for action, data_list in data_by_action.items():
+            task_type = type_by_action.get(action)
+            if not task_type:
+                _logger.warning('BeTaskType not found: %s-%s-%s', target, obj, action)
+                continue
+            vals_list.extend({
+                'name': f'{target}-{obj}-{action}-{now}',
+                'betasktype_id': task_type.id,
+                'status': 'new',
+                'data': data,
+                'data2': None,
+            } for data in data_list)
+        
+        if not vals_list:
+            return None
+        return BeTask.create(vals_list)
+
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
@@ -4687,23 +4792,32 @@ class BeTaskProcessor(models.AbstractModel):
                 source='BE'
             )
         except Exception:
-            _logger.info(f'SysEvent [{code}]: {message}')
+            _logger.info('SysEvent [%s]: %s', code, message)
     
     @api.model
-    def _log_error(self, code, message, blocking=False):
-        """Log error to SysEvent."""
+    def _log_error(self, code, message, blocking=False, exc_info=False):
+        """
+        Log error to SysEvent.
+        
+        @param exc_info: If True, append the current traceback to the stored message
+        @return: True if the SysEvent was created
+        """
+        if exc_info:
+            message = f'{message}\n{traceback.format_exc()}'
         try:
             sys_event_service = self.env['myschool.sys.event.service']
             error_type = 'ERROR-BLOCKING' if blocking else 'ERROR-NONBLOCKING'
-            sys_event_service.create_sys_error(
+            error_event = sys_event_service.create_sys_error(
                 code=code,
                 data=message,
                 error_type=error_type,
                 log_to_screen=True,
                 source='BE'
             )
+            return bool(error_event)
         except Exception:
-            _logger.error(f'SysError [{code}]: {message}')
+            _logger.error('SysError [%s]: %s', code, message)
+            return False
 
     # =========================================================================
     # GENERIC PROPRELATION HELPERS
@@ -4731,6 +4845,14 @@ class BeTaskProcessor(models.AbstractModel):
         'priority': 'priority', 'is_active': 'is_active', 'active': 'is_active',
     }
 
+    # Relation fields of a PropRelation (targets of the mapping above)
+    PROPRELATION_ID_FIELDS = frozenset({
+        'id_org', 'id_org_parent', 'id_org_child',
+        'id_role', 'id_role_parent', 'id_role_child',
+        'id_person', 'id_person_parent', 'id_person_child',
+        'id_period', 'id_period_parent', 'id_period_child',
+    })
+
     def _translate_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Translate friendly parameter names to PropRelation field names.
@@ -4761,10 +4883,48 @@ class BeTaskProcessor(models.AbstractModel):
             if usage:
                 vals['usage'] = usage
             rel_type = PropRelationType.create(vals)
-            _logger.info(f'Created PropRelationType: {type_name}')
+            _logger.info('Created PropRelationType: %s', type_name)
         
         return rel_type
 
+    def _resolve_proprelation_name_values(self, ids_by_field: Dict[str, int]) -> Dict[str, str]:
+        """
+        Resolve relation ids to the strings used by build_proprelation_name.
+        
+        Each related model is read once for all of its ids.
+        
+        @param ids_by_field: Dict PropRelation field name -> record id (falsy ids are skipped)
+        @return: Dict field name -> name string, usable as build_proprelation_name kwargs
+        """
+        PropRelation = self.env['myschool.proprelation']
+        
+        # model -> {field_name: record_id}
+        ids_by_model = defaultdict(dict)
+        for field_name, record_id in ids_by_field.items():
+            if record_id:
+                ids_by_model[PropRelation._fields[field_name].comodel_name][field_name] = record_id
+        
+        values = {}
+        for model_name, field_ids in ids_by_model.items():
+            Model = self.env[model_name]
+            read_fields = {'name'}
+            for field_name in field_ids:
+                read_fields.add(PROPRELATION_NAME_FIELD_MAP[field_name][1])
+            rows = {
+                row['id']: row
+                for row in Model.browse(set(field_ids.values())).read(list(read_fields), load=None)
+            }
+            for field_name, record_id in field_ids.items():
+                row = rows.get(record_id)
+                if not row:
+                    continue
+                primary_field = PROPRELATION_NAME_FIELD_MAP[field_name][1]
+                value = row.get(primary_field) or row.get('name')
+                if value:
+                    values[field_name] = value
+        
+        return values
+
     def _create_proprelation(
         self,
         type_name: str,
@@ -4809,19 +4969,18 @@ class BeTaskProcessor(models.AbstractModel):
         }
         
         # Add translated fields, converting records to IDs
-        name_kwargs = {}
+        name_ids = {}
         for field_name, value in translated.items():
-            if field_name.startswith('id_'):
+            if field_name in self.PROPRELATION_ID_FIELDS:
                 # This is a relation field
                 if value:
-                    record_id = value.id if hasattr(value, 'id') else value
-                    vals[field_name] = record_id
-                    name_kwargs[field_name] = value  # Keep record for name building
+                    vals[field_name] = name_ids[field_name] = getattr(value, 'id', value)
             elif field_name in ('priority', 'is_active'):
                 vals[field_name] = value
         
         # Generate name if auto_name
         if auto_name:
+            name_kwargs = self._resolve_proprelation_name_values(name_ids)
             vals['name'] = build_proprelation_name(type_name, **name_kwargs)
         elif 'name' in kwargs:
             vals['name'] = kwargs['name']
@@ -4830,7 +4989,7 @@ class BeTaskProcessor(models.AbstractModel):
         
         # Create the record
         proprel = PropRelation.create(vals)
-        _logger.info(f'Created PropRelation: {proprel.name} (ID: {proprel.id})')
+        _logger.info('Created PropRelation: %s (ID: %s)', proprel.name, proprel.id)
         
         return proprel
 
@@ -4912,7 +5071,7 @@ class BeTaskProcessor(models.AbstractModel):
                 name_kwargs = {k: v for k, v in translated.items() if k.startswith('id_') and v}
                 update_vals['name'] = build_proprelation_name(type_name, **name_kwargs)
             inactive.write(update_vals)
-            _logger.info(f'Reactivated PropRelation: {inactive.name} (ID: {inactive.id})')
+            _logger.info('Reactivated PropRelation: %s (ID: %s)', inactive.name, inactive.id)
             return inactive, False
         
         # Create new
@@ -4931,26 +5090,18 @@ class BeTaskProcessor(models.AbstractModel):
         
         type_name = proprel.proprelation_type_id.name
         
-        # Build kwargs from existing fields
-        kwargs = {}
-        field_names = [
-            'id_org', 'id_org_parent', 'id_org_child',
-            'id_role', 'id_role_parent', 'id_role_child',
-            'id_person', 'id_person_parent', 'id_person_child',
-            'id_period', 'id_period_parent', 'id_period_child',
-        ]
-        
-        for field_name in field_names:
-            if hasattr(proprel, field_name):
-                value = getattr(proprel, field_name)
-                if value:
-                    kwargs[field_name] = value
+        # Build kwargs from existing fields, read in a single call
+        field_names = list(self.PROPRELATION_ID_FIELDS)
+        data = proprel.read(field_names, load=None)[0]
+        kwargs = self._resolve_proprelation_name_values({
+            field_name: data[field_name] for field_name in field_names
+        })
         
         if kwargs:
             new_name = build_proprelation_name(type_name, **kwargs)
             if proprel.name != new_name:
                 proprel.write({'name': new_name})
-                _logger.debug(f'Updated PropRelation name: {new_name}')
+                _logger.debug('Updated PropRelation name: %s', new_name)
                 return True
         
         return False
@@ -5393,9 +5544,10 @@ class BeTaskProcessor(models.AbstractModel):
         
         try:
             results = self.process_all_pending()
-            _logger.info(f'Cron job completed: {results}')
+            _logger.info('Cron job completed: %s', results)
             return results
         except Exception as e:
-            _logger.exception('Cron job failed')
-            self._log_error('BETASK-999', f'Cron job failed: {str(e)}', blocking=True)
+            # The SysEvent already logs the error; only fall back to the logger when it could not be stored
+            if not self._log_error('BETASK-999', f'Cron job failed: {str(e)}', blocking=True, exc_info=True):
+                _logger.exception('Cron job failed')
             return False
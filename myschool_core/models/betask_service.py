@@ -11,15 +11,30 @@ Java Methods Implemented:
 - findAll() -> find_all()
 - registerOrUpdateBeTask(BeTask beTask) -> register_or_update(vals)
 - createBeTask(pTarget, pObj, pAction, pData1, pData2) -> create_task(target, obj, action, data, data2)
+
+Additional methods:
+- create_tasks_bulk(specs): create many tasks with one INSERT
 """
 
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from odoo.tools import split_every
 import logging
 import json
 
 _logger = logging.getLogger(__name__)
 
+# Shared encoder for task data: compact separators and unescaped non-ASCII
+# characters keep the stored JSON small; readers only parse it with json.loads
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), check_circular=False)
+
+
+def _to_task_data(value):
+    """Serialize dict task data to JSON; strings and other values are stored as given."""
+    if isinstance(value, dict):
+        return _JSON_ENCODER.encode(value)
+    return value
+
 
 class BeTaskService(models.AbstractModel):
     """
@@ -69,7 +84,10 @@ class BeTaskService(models.AbstractModel):
         
         # Handle task_type parameter
         if task_type:
-            if isinstance(task_type, str):
+            if isinstance(task_type, models.BaseModel):
+                # Most common case: a task type record
+                domain.append(('betasktype_id', '=', task_type.id))
+            elif isinstance(task_type, str):
                 # Find by name
                 type_service = self.env['myschool.betask.type.service']
                 type_record = type_service.find_by_name(task_type)
@@ -134,25 +152,27 @@ class BeTaskService(models.AbstractModel):
         return self.env['myschool.betask'].search([])
     
     @api.model
-    def find_pending(self):
+    def find_pending(self, limit=None):
         """
         Find all pending (new) tasks
         
+        :param limit: Optional maximum number of tasks, to process large queues in bounded batches
         :return: Recordset of pending tasks
         """
         return self.env['myschool.betask'].search([
             ('status', '=', 'new'),
             ('automatic_sync', '=', True)
-        ])
+        ], limit=limit)
     
     @api.model
-    def find_errors(self):
+    def find_errors(self, limit=None):
         """
         Find all tasks in error status
         
+        :param limit: Optional maximum number of tasks, to process large sets in bounded batches
         :return: Recordset of error tasks
         """
-        return self.env['myschool.betask'].search([('status', '=', 'error')])
+        return self.env['myschool.betask'].search([('status', '=', 'error')], limit=limit)
     
     @api.model
     def find_manual_tasks(self):
@@ -191,17 +211,85 @@ class BeTaskService(models.AbstractModel):
         if not isinstance(vals, dict):
             raise ValidationError(_('Invalid task data provided'))
         
-        # If ID is provided, update existing
+        # If ID is provided, update existing. search_fetch() checks the id and loads
+        # the fields being written (needed for tracking) in the same SELECT.
         if vals.get('id'):
-            existing = BeTask.browse(vals['id']).exists()
+            update_vals = {k: vals[k] for k in vals.keys() - {'id'}}
+            existing = BeTask.with_context(active_test=False).search_fetch(
+                [('id', '=', vals['id'])],
+                list(update_vals.keys() & BeTask._fields.keys()),
+            )
             if existing:
-                update_vals = {k: v for k, v in vals.items() if k != 'id'}
                 existing.write(update_vals)
                 return existing
         
         # Create new
         return BeTask.create(vals)
     
+    # Transaction-local cache key: (target, obj, action) -> betask.type id
+    _TASK_TYPE_CACHE_KEY = 'myschool_betask_type_ids'
+    
+    @api.model
+    def _get_cached_task_type(self, target, obj, action):
+        """
+        Find (or auto-create) the task type for a target/object/action triple
+        
+        The resolved id is memoized on the cursor, so creating many tasks of
+        the same type in one transaction only looks the type up once.
+        BeTaskType clears this cache on create, write and unlink.
+        
+        :return: Task type record
+        """
+        cache = self.env.cr.cache.setdefault(self._TASK_TYPE_CACHE_KEY, {})
+        key = (target, obj, action)
+        type_id = cache.get(key)
+        if type_id:
+            return self.env['myschool.betask.type'].browse(type_id)
+        
+        type_service = self.env['myschool.betask.type.service']
+        task_type = type_service.find_by_target_object_action(target, obj, action)
+        
+        if not task_type:
+            # Auto-create task type if it doesn't exist
+            _logger.warning('Task type not found, creating: %s_%s_%s', target, obj, action)
+            task_type = type_service.create_task_type(target, obj, action)
+        
+        cache[key] = task_type.id
+        return task_type
+    
+    @api.model
+    def _log_task_created_postcommit(self, task_id, type_name):
+        """
+        Queue a BETASK_CREATED SysEvent to be written after the commit
+        
+        The events of one transaction are written together in a separate
+        cursor once it commits, keeping the INSERTs out of create_task.
+        Nothing is logged when the transaction is rolled back.
+        """
+        postcommit = self.env.cr.postcommit
+        events = postcommit.data.setdefault('myschool.betask.created', [])
+        if not events:
+            registry = self.env.registry
+            uid = self.env.uid
+            context = self.env.context
+            
+            @postcommit.add
+            def _create_sys_events():
+                with registry.cursor() as cr:
+                    env = api.Environment(cr, uid, context)
+                    sys_event_service = env['myschool.sys.event.service']
+                    for created_id, created_type in events:
+                        try:
+                            sys_event_service.create_sys_event(
+                                code='BETASK_CREATED',
+                                data=f'Task {created_id} created: {created_type}',
+                                log_to_screen=False,
+                                source='BE'
+                            )
+                        except Exception:
+                            pass  # SysEvent logging is optional
+        events.append((task_id, type_name))
+    
     @api.model
     def create_task(self, target, obj, action, data=None, data2=None, auto_sync=True):
         """
@@ -228,19 +316,11 @@ class BeTaskService(models.AbstractModel):
         """
         try:
             # Find the task type
-            type_service = self.env['myschool.betask.type.service']
-            task_type = type_service.find_by_target_object_action(target, obj, action)
-            
-            if not task_type:
-                # Auto-create task type if it doesn't exist
-                _logger.warning(f'Task type not found, creating: {target}_{obj}_{action}')
-                task_type = type_service.create_task_type(target, obj, action)
+            task_type = self._get_cached_task_type(target, obj, action)
             
             # Prepare data - convert dict to JSON string if needed
-            if isinstance(data, dict):
-                data = json.dumps(data)
-            if isinstance(data2, dict):
-                data2 = json.dumps(data2)
+            data = _to_task_data(data)
+            data2 = _to_task_data(data2)
             
             # Create the task
             task_vals = {
@@ -253,24 +333,17 @@ class BeTaskService(models.AbstractModel):
             
             task = self.env['myschool.betask'].create(task_vals)
             
-            _logger.info(f'BeTask created: [{task.name}] {task_type.name}')
+            # Type names follow TARGET_OBJECT_ACTION; build it instead of reading records back
+            type_name = f'{target}_{obj}_{action}'
+            _logger.info('BeTask created: [%s] %s', task.id, type_name)
             
-            # Log to SysEvent
-            try:
-                sys_event_service = self.env['myschool.sys.event.service']
-                sys_event_service.create_sys_event(
-                    code='BETASK_CREATED',
-                    data=f'Task {task.name} created: {task_type.name}',
-                    log_to_screen=False,
-                    source='BE'
-                )
-            except Exception:
-                pass  # SysEvent logging is optional
+            # Log to SysEvent once the transaction is committed
+            self._log_task_created_postcommit(task.id, type_name)
             
             return task
             
         except Exception as e:
-            _logger.exception(f"Error creating task: {target}_{obj}_{action}")
+            _logger.exception('Error creating task: %s_%s_%s', target, obj, action)
             
             # Try to log error to SysEvent
             try:
@@ -304,10 +377,8 @@ class BeTaskService(models.AbstractModel):
             raise ValidationError(_('Invalid task type'))
         
         # Prepare data
-        if isinstance(data, dict):
-            data = json.dumps(data)
-        if isinstance(data2, dict):
-            data2 = json.dumps(data2)
+        data = _to_task_data(data)
+        data2 = _to_task_data(data2)
         
         task_vals = {
             'betasktype_id': task_type.id,
@@ -326,28 +397,136 @@ class BeTaskService(models.AbstractModel):
     # Bulk Operations
     # =========================================================================
     
+    @api.model
+    def create_tasks_bulk(self, specs):
+        """
+        Create several backend tasks at once
+        
+        Bulk variant of create_task: all task types are resolved with one
+        search (missing types are created in one call), the tasks are
+        inserted with a single create() and one SysEvent summarizes the batch.
+        
+        :param specs: List of dicts with keys 'target', 'obj', 'action' and
+                      optionally 'data', 'data2', 'auto_sync' (default True)
+        :return: Recordset of created tasks
+        
+        Example:
+            service = self.env['myschool.betask.service']
+            tasks = service.create_tasks_bulk([
+                {'target': 'DB', 'obj': 'ORG', 'action': 'ADD', 'data': {...}},
+                {'target': 'DB', 'obj': 'ORG', 'action': 'UPD', 'data': {...}},
+            ])
+        """
+        BeTask = self.env['myschool.betask']
+        if not specs:
+            return BeTask
+        
+        TaskType = self.env['myschool.betask.type']
+        keys = {(spec['target'], spec['obj'], spec['action']) for spec in specs}
+        
+        # Resolve all task types in one search
+        task_types = TaskType.search([
+            ('target', 'in', list({key[0] for key in keys})),
+            ('object', 'in', list({key[1] for key in keys})),
+            ('action', 'in', list({key[2] for key in keys})),
+        ])
+        type_map = {}
+        for task_type in task_types:
+            type_map.setdefault((task_type.target, task_type.object, task_type.action), task_type)
+        
+        # Auto-create missing task types in one call
+        missing = sorted(keys - set(type_map))
+        if missing:
+            _logger.warning(f'Task types not found, creating: {missing}')
+            new_types = TaskType.create([{
+                'target': target,
+                'object': obj,
+                'action': action,
+                'description': f'Task type for {target} {obj} {action}',
+            } for target, obj, action in missing])
+            type_map.update(zip(missing, new_types))
+        
+        vals_list = []
+        for spec in specs:
+            data = spec.get('data')
+            data2 = spec.get('data2')
+            # Prepare data - convert dict to JSON string if needed
+            data = _to_task_data(data)
+            data2 = _to_task_data(data2)
+            vals_list.append({
+                'betasktype_id': type_map[(spec['target'], spec['obj'], spec['action'])].id,
+                'status': 'new',
+                'data': data,
+                'data2': data2,
+                'automatic_sync': spec.get('auto_sync', True),
+            })
+        
+        tasks = BeTask.create(vals_list)
+        _logger.info(f'BeTasks created in bulk: {len(tasks)}')
+        
+        # Log one SysEvent for the whole batch
+        try:
+            sys_event_service = self.env['myschool.sys.event.service']
+            sys_event_service.create_sys_event(
+                code='BETASK_CREATED',
+                data=f'{len(tasks)} tasks created: {", ".join(sorted(f"{t}_{o}_{a}" for t, o, a in keys))}',
+                log_to_screen=False,
+                source='BE'
+            )
+        except Exception:
+            pass  # SysEvent logging is optional
+        
+        return tasks
+    
+    # Number of tasks handled per batch in bulk operations
+    _RESET_BATCH_SIZE = 1000
+    
+    @api.model
+    def _get_task_type_id(self, task_type):
+        """
+        Get the id of a task type given as record or ID
+        
+        :param task_type: Task type record, ID or None
+        :return: Task type ID or None
+        """
+        if isinstance(task_type, int):
+            return task_type
+        if hasattr(task_type, 'id'):
+            return task_type.id
+        return None
+    
     @api.model
     def reset_error_tasks(self, task_type=None):
         """
         Reset all error tasks to new status
         
+        Tasks that already reached max_retries are filtered out in SQL.
+        
         :param task_type: Optional task type to filter
         :return: Number of tasks reset
         """
-        domain = [('status', '=', 'error')]
-        if task_type:
-            if isinstance(task_type, int):
-                domain.append(('betasktype_id', '=', task_type))
-            elif hasattr(task_type, 'id'):
-                domain.append(('betasktype_id', '=', task_type.id))
-        
-        error_tasks = self.env['myschool.betask'].search(domain)
+        BeTask = self.env['myschool.betask']
+        BeTask.flush_model(['status', 'active', 'betasktype_id', 'retry_count', 'max_retries'])
         
-        reset_count = 0
-        for task in error_tasks:
-            if task.retry_count < task.max_retries:
-                task.action_reset_to_new()
-                reset_count += 1
+        query = """
+            SELECT id FROM myschool_betask
+            WHERE status = 'error' AND active AND retry_count < max_retries
+        """
+        params = []
+        type_id = self._get_task_type_id(task_type) if task_type else None
+        if type_id:
+            query += " AND betasktype_id = %s"
+            params.append(type_id)
+        self.env.cr.execute(query, params)
+        
+        error_task_ids = [row[0] for row in self.env.cr.fetchall()]
+        
+        # Reset in fixed-size batches so the prefetch set stays bounded
+        for error_tasks in split_every(self._RESET_BATCH_SIZE, error_task_ids, BeTask.browse):
+            # Load the fields checked by action_reset_to_new in one query per batch
+            error_tasks.fetch(['name', 'retry_count', 'max_retries'])
+            error_tasks.action_reset_to_new()
+        reset_count = len(error_task_ids)
         
         _logger.info(f'Reset {reset_count} error tasks to new status')
         return reset_count
@@ -357,21 +536,31 @@ class BeTaskService(models.AbstractModel):
         """
         Cancel all pending tasks (set to archived)
         
+        Archives the tasks with a single UPDATE instead of loading them first.
+        
         :param task_type: Optional task type to filter
         :return: Number of tasks cancelled
         """
-        domain = [('status', '=', 'new')]
-        if task_type:
-            if isinstance(task_type, int):
-                domain.append(('betasktype_id', '=', task_type))
-            elif hasattr(task_type, 'id'):
-                domain.append(('betasktype_id', '=', task_type.id))
-        
-        pending_tasks = self.env['myschool.betask'].search(domain)
-        pending_tasks.write({'active': False})
+        BeTask = self.env['myschool.betask']
+        BeTask.flush_model(['status', 'active', 'betasktype_id'])
         
-        _logger.info(f'Cancelled {len(pending_tasks)} pending tasks')
-        return len(pending_tasks)
+        query = """
+            UPDATE myschool_betask
+            SET active = false, write_uid = %s, write_date = (now() at time zone 'UTC')
+            WHERE status = 'new' AND active
+        """
+        params = [self.env.uid]
+        type_id = self._get_task_type_id(task_type) if task_type else None
+        if type_id:
+            query += " AND betasktype_id = %s"
+            params.append(type_id)
+        query += " RETURNING id"
+        self.env.cr.execute(query, params)
+        cancelled_count = self.env.cr.rowcount
+        BeTask.invalidate_model(['active', 'write_uid', 'write_date'])
+        
+        _logger.info(f'Cancelled {cancelled_count} pending tasks')
+        return cancelled_count
     
     @api.model
     def get_task_statistics(self):
@@ -380,16 +569,29 @@ class BeTaskService(models.AbstractModel):
         
         :return: Dictionary with task statistics
         """
-        BeTask = self.env['myschool.betask']
-        return {
-            'total': BeTask.search_count([]),
-            'new': BeTask.search_count([('status', '=', 'new')]),
-            'processing': BeTask.search_count([('status', '=', 'processing')]),
-            'completed': BeTask.search_count([('status', '=', 'completed_ok')]),
-            'error': BeTask.search_count([('status', '=', 'error')]),
-            'manual_pending': BeTask.search_count([
-                ('target', '=', 'MANUAL'),
-                ('status', '=', 'new'),
-                ('automatic_sync', '=', False),
-            ]),
+        # One grouped query instead of a COUNT per statistic
+        groups = self.env['myschool.betask']._read_group(
+            [], groupby=['status', 'target', 'automatic_sync'], aggregates=['__count'],
+        )
+        
+        stats = {
+            'total': 0,
+            'new': 0,
+            'processing': 0,
+            'completed': 0,
+            'error': 0,
+            'manual_pending': 0,
+        }
+        status_keys = {
+            'new': 'new',
+            'processing': 'processing',
+            'completed_ok': 'completed',
+            'error': 'error',
         }
+        for status, target, automatic_sync, count in groups:
+            stats['total'] += count
+            if status in status_keys:
+                stats[status_keys[status]] += count
+            if target == 'MANUAL' and status == 'new' and not automatic_sync:
+                stats['manual_pending'] += count
+        return stats
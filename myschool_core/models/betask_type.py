@@ -9,6 +9,8 @@ BeTaskType defines the type of backend task based on:
 - ACTION: What operation to perform (ADD, UPD, DEL, etc.)
 """
 
+from collections import defaultdict
+
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 
@@ -146,11 +148,28 @@ class BeTaskType(models.Model):
     
     @api.depends('task_ids', 'task_ids.status')
     def _compute_task_statistics(self):
+        # Count in the database instead of loading every task into the cache
+        total = defaultdict(int)
+        pending = defaultdict(int)
+        errors = defaultdict(int)
+        type_ids = [type_id for type_id in self._origin.ids if type_id]
+        if type_ids:
+            groups = self.env['myschool.betask']._read_group(
+                [('betasktype_id', 'in', type_ids)],
+                groupby=['betasktype_id', 'status'],
+                aggregates=['__count'],
+            )
+            for task_type, status, count in groups:
+                total[task_type.id] += count
+                if status == 'new':
+                    pending[task_type.id] += count
+                elif status == 'error':
+                    errors[task_type.id] += count
         for record in self:
-            tasks = record.task_ids
-            record.task_count = len(tasks)
-            record.pending_task_count = len(tasks.filtered(lambda t: t.status == 'new'))
-            record.error_task_count = len(tasks.filtered(lambda t: t.status == 'error'))
+            type_id = record._origin.id
+            record.task_count = total[type_id]
+            record.pending_task_count = pending[type_id]
+            record.error_task_count = errors[type_id]
     
     @api.model_create_multi
     def create(self, vals_list):
@@ -169,18 +188,45 @@ class BeTaskType(models.Model):
                 action = vals.get('action', '').lower()
                 vals['processor_method'] = f"process_{target}_{obj}_{action}"
         
+        self._clear_task_type_cache()
         return super().create(vals_list)
     
     def write(self, vals):
         # Regenerate name if components change
-        if any(k in vals for k in ['target', 'object', 'action']):
-            for record in self:
-                target = vals.get('target', record.target)
-                obj = vals.get('object', record.object)
-                action = vals.get('action', record.action)
-                vals['name'] = f"{target}_{obj}_{action}"
+        component_keys = [k for k in ('target', 'object', 'action') if k in vals]
+        if component_keys or 'active' in vals:
+            self._clear_task_type_cache()
+        if component_keys:
+            # Records whose components are written with their current values keep their name
+            changed = self.filtered(lambda r: any(r[k] != vals[k] for k in component_keys))
+            if changed:
+                ids_by_name = defaultdict(list)
+                for record in changed:
+                    target = vals.get('target', record.target)
+                    obj = vals.get('object', record.object)
+                    action = vals.get('action', record.action)
+                    ids_by_name[f"{target}_{obj}_{action}"].append(record.id)
+                unchanged = self - changed
+                if len(ids_by_name) == 1 and not unchanged:
+                    vals['name'] = next(iter(ids_by_name))
+                else:
+                    # Records end up with different names: write each group separately
+                    for name, ids in ids_by_name.items():
+                        super(BeTaskType, self.browse(ids)).write(dict(vals, name=name))
+                    if unchanged:
+                        super(BeTaskType, unchanged).write(vals)
+                    return True
         return super().write(vals)
     
+    def unlink(self):
+        self._clear_task_type_cache()
+        return super().unlink()
+    
+    def _clear_task_type_cache(self):
+        """Drop the (target, object, action) lookup caches of the task and task type services."""
+        self.env.cr.cache.pop(self.env['myschool.betask.service']._TASK_TYPE_CACHE_KEY, None)
+        self.env.registry.clear_cache()
+    
     _name_unique = models.Constraint('UNIQUE(name)', 'Task type name must be unique!')
     _target_object_action_unique = models.Constraint(
         'UNIQUE(target, object, action)',
@@ -13,7 +13,7 @@ Java Methods Implemented:
 - findBeTaskTypeByTargetAndObjectAndAction(...) -> find_by_target_object_action(...)
 """
 
-from odoo import models, api, _
+from odoo import models, api, tools, _
 from odoo.exceptions import ValidationError
 import logging
 
@@ -42,12 +42,16 @@ class BeTaskTypeService(models.AbstractModel):
         Find task type by ID
         Equivalent to: findBeTaskTypeById(String id)
         
+        Existence is not checked: accessing a field of a deleted task type
+        raises MissingError. Callers that need it should call exists().
+        
         :param type_id: Task type ID
         :return: Task type record or empty recordset
         """
+        TaskType = self.env['myschool.betask.type']
         if not type_id:
-            return self.env['myschool.betask.type']
-        return self.env['myschool.betask.type'].browse(type_id).exists()
+            return TaskType
+        return TaskType.browse(int(type_id))
     
     @api.model
     def find_by_name(self, name):
@@ -58,10 +62,10 @@ class BeTaskTypeService(models.AbstractModel):
         :param name: Name of the task type
         :return: Task type record (empty recordset if not found)
         """
+        TaskType = self.env['myschool.betask.type']
         if not name:
-            return self.env['myschool.betask.type']
-        result = self.env['myschool.betask.type'].search([('name', '=', name)], limit=1)
-        return result
+            return TaskType
+        return TaskType.search([('name', '=', name)], limit=1)
     
     @api.model
     def find_by_action(self, action):
@@ -72,9 +76,10 @@ class BeTaskTypeService(models.AbstractModel):
         :param action: Action (ADD, UPD, DEL, etc.)
         :return: Task type record (empty recordset if not found)
         """
+        TaskType = self.env['myschool.betask.type']
         if not action:
-            return self.env['myschool.betask.type']
-        return self.env['myschool.betask.type'].search([('action', '=', action)], limit=1)
+            return TaskType
+        return TaskType.search([('action', '=', action)], limit=1)
     
     @api.model
     def find_by_target(self, target):
@@ -85,9 +90,10 @@ class BeTaskTypeService(models.AbstractModel):
         :param target: Target (DB, AD, CLOUD, etc.)
         :return: Task type record (empty recordset if not found)
         """
+        TaskType = self.env['myschool.betask.type']
         if not target:
-            return self.env['myschool.betask.type']
-        return self.env['myschool.betask.type'].search([('target', '=', target)], limit=1)
+            return TaskType
+        return TaskType.search([('target', '=', target)], limit=1)
     
     @api.model
     def find_by_target_object_action(self, target, obj, action):
@@ -100,14 +106,42 @@ class BeTaskTypeService(models.AbstractModel):
         :param action: Action (ADD, UPD, DEL, etc.)
         :return: Task type record (empty recordset if not found)
         """
+        TaskType = self.env['myschool.betask.type']
         if not all([target, obj, action]):
-            return self.env['myschool.betask.type']
+            return TaskType
         
-        return self.env['myschool.betask.type'].search([
-            ('target', '=', target),
-            ('object', '=', obj),
-            ('action', '=', action)
-        ], limit=1)
+        type_id = self._find_id_by_target_object_action(target, obj, action)
+        return TaskType.browse(type_id).exists()
+    
+    @api.model
+    @tools.ormcache('target', 'obj', 'action')
+    def _find_id_by_target_object_action(self, target, obj, action):
+        """
+        Cached id lookup behind find_by_target_object_action
+        
+        myschool.betask.type clears the cache on create, write and unlink.
+        
+        :return: Task type ID or False
+        """
+        return self._exists_tta(target, obj, action)
+    
+    @api.model
+    def _exists_tta(self, target, obj, action):
+        """
+        Id of the active task type for a (target, object, action) triple,
+        looked up with plain SQL on the UNIQUE(target, object, action) index
+        
+        :return: Task type ID or False
+        """
+        self.env['myschool.betask.type'].flush_model(['target', 'object', 'action', 'active'])
+        self.env.cr.execute(
+            "SELECT id FROM myschool_betask_type"
+            " WHERE target = %s AND object = %s AND action = %s AND active"
+            " LIMIT 1",
+            (target, obj, action),
+        )
+        row = self.env.cr.fetchone()
+        return row[0] if row else False
     
     @api.model
     def find_all_by_target_object_action(self, target, obj, action):
@@ -117,6 +151,9 @@ class BeTaskTypeService(models.AbstractModel):
         
         :return: Recordset of matching task types
         """
+        if not (target or obj or action):
+            return self.find_all()
+        
         domain = []
         if target:
             domain.append(('target', '=', target))
@@ -135,7 +172,24 @@ class BeTaskTypeService(models.AbstractModel):
         
         :return: Recordset of all task types
         """
-        return self.env['myschool.betask.type'].search([])
+        TaskType = self.env['myschool.betask.type']
+        # The cached ids are shared between users
+        TaskType.check_access('read')
+        return TaskType.browse(self._find_all_ids(self.env.context.get('active_test', True)))
+    
+    @api.model
+    @tools.ormcache('active_test')
+    def _find_all_ids(self, active_test):
+        """
+        Cached id lookup behind find_all
+        
+        myschool.betask.type clears the cache on create, write and unlink.
+        
+        :param active_test: Whether inactive task types are left out
+        :return: Tuple of task type IDs
+        """
+        TaskType = self.env['myschool.betask.type'].with_context(active_test=active_test)
+        return tuple(TaskType.search([]).ids)
     
     @api.model
     def find_all_active(self):
@@ -179,30 +233,51 @@ class BeTaskTypeService(models.AbstractModel):
         if not isinstance(vals, dict):
             raise ValidationError(_('Invalid task type data provided'))
         
+        # Try to find by ID first: a single primary key lookup
+        if vals.get('id'):
+            existing = TaskType.browse(vals['id']).exists()
+            if existing:
+                update_vals = {k: v for k, v in vals.items() if k != 'id'}
+                if self._write_if_changed(existing, update_vals):
+                    _logger.info('Updated BeTaskType by ID: %s', existing.name)
+                return existing
+        
         # Try to find existing by target/object/action combination
         if all(k in vals for k in ['target', 'object', 'action']):
             existing = self.find_by_target_object_action(
                 vals['target'], vals['object'], vals['action']
             )
             if existing:
-                existing.write(vals)
-                _logger.info(f'Updated BeTaskType: {existing.name}')
-                return existing
-        
-        # Try to find by ID
-        if vals.get('id'):
-            existing = TaskType.browse(vals['id']).exists()
-            if existing:
-                update_vals = {k: v for k, v in vals.items() if k != 'id'}
-                existing.write(update_vals)
-                _logger.info(f'Updated BeTaskType by ID: {existing.name}')
+                if self._write_if_changed(existing, vals):
+                    _logger.info('Updated BeTaskType: %s', existing.name)
                 return existing
         
         # Create new
         new_type = TaskType.create(vals)
-        _logger.info(f'Created new BeTaskType: {new_type.name}')
+        _logger.info('Created new BeTaskType: %s', new_type.name)
         return new_type
     
+    @api.model
+    def _write_if_changed(self, task_type, vals):
+        """
+        Write vals on a task type only when at least one value differs
+        
+        Avoids no-op writes (and the cache invalidations they trigger) for
+        idempotent register_or_update calls.
+        
+        :param task_type: Task type record
+        :param vals: Values to write
+        :return: True if a write was done
+        """
+        if not vals:
+            return False
+        if vals.keys() <= task_type._fields.keys():
+            current = task_type.read(list(vals), load=None)[0]
+            if all(current[k] == v for k, v in vals.items()):
+                return False
+        task_type.write(vals)
+        return True
+    
     @api.model
     def create_task_type(self, target, obj, action, description=None):
         """
@@ -218,7 +293,7 @@ class BeTaskTypeService(models.AbstractModel):
         # Check if already exists
         existing = self.find_by_target_object_action(target, obj, action)
         if existing:
-            _logger.info(f'BeTaskType already exists: {existing.name}')
+            _logger.info('BeTaskType already exists: %s', existing.name)
             return existing
         
         # Create new (name is auto-generated in model)
@@ -230,7 +305,7 @@ class BeTaskTypeService(models.AbstractModel):
         }
         
         task_type = self.env['myschool.betask.type'].create(vals)
-        _logger.info(f'Created BeTaskType: {task_type.name}')
+        _logger.info('Created BeTaskType: %s', task_type.name)
         return task_type
     
     @api.model
@@ -253,9 +328,54 @@ class BeTaskTypeService(models.AbstractModel):
                 **kwargs
             }
             task_type = self.env['myschool.betask.type'].create(vals)
-            _logger.info(f'Created BeTaskType: {task_type.name}')
+            _logger.info('Created BeTaskType: %s', task_type.name)
         return task_type
     
+    @api.model
+    def get_or_create_many(self, triples, defaults=None, vals_by_triple=None):
+        """
+        Get task types for several (target, object, action) triples, creating
+        the missing ones with a single search and a single create
+        
+        :param triples: List of (target, object, action) tuples
+        :param defaults: Additional fields for every created task type
+        :param vals_by_triple: Additional fields per triple, override defaults
+        :return: Recordset of task types, in the order of triples
+        """
+        TaskType = self.env['myschool.betask.type']
+        triples = [tuple(triple) for triple in triples]
+        if not triples:
+            return TaskType
+        
+        targets, objs, actions = zip(*triples)
+        existing = TaskType.search_read([
+            ('target', 'in', list(set(targets))),
+            ('object', 'in', list(set(objs))),
+            ('action', 'in', list(set(actions))),
+        ], ['target', 'object', 'action'])
+        by_key = {(r['target'], r['object'], r['action']): r['id'] for r in existing}
+        
+        vals_by_triple = vals_by_triple or {}
+        missing = []
+        for triple in dict.fromkeys(triples):
+            if triple not in by_key:
+                target, obj, action = triple
+                missing.append({
+                    'target': target,
+                    'object': obj,
+                    'action': action,
+                    **(defaults or {}),
+                    **vals_by_triple.get(triple, {}),
+                })
+        if missing:
+            for task_type in TaskType.with_context(
+                tracking_disable=True, mail_notrack=True, mail_create_nolog=True,
+            ).create(missing):
+                by_key[(task_type.target, task_type.object, task_type.action)] = task_type.id
+                _logger.info('Created BeTaskType: %s', task_type.name)
+        
+        return TaskType.browse([by_key[triple] for triple in triples])
+    
     @api.model
     def ensure_standard_types(self):
         """
@@ -289,10 +409,11 @@ class BeTaskTypeService(models.AbstractModel):
             ('MANUAL', 'CONFIG', 'MANUAL', 'Manual configuration task'),
         ]
         
-        created = []
-        for target, obj, action, desc in standard_types:
-            task_type = self.get_or_create(target, obj, action, description=desc)
-            created.append(task_type)
+        triples = [(target, obj, action) for target, obj, action, _desc in standard_types]
+        created = list(self.get_or_create_many(triples, vals_by_triple={
+            (target, obj, action): {'description': desc}
+            for target, obj, action, desc in standard_types
+        }))
         
-        _logger.info(f'Ensured {len(created)} standard BeTaskTypes exist')
+        _logger.info('Ensured %s standard BeTaskTypes exist', len(created))
         return created
@@ -18,8 +18,10 @@ Converted from Java:
 """
 
 from odoo import models, fields, api, _
+from odoo.tools import SQL
 from odoo.exceptions import UserError, ValidationError
 from typing import Optional, List
+from collections import defaultdict
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -45,9 +47,7 @@ class CiRelation(models.Model):
 
     name = fields.Char(
         string="Name",
-        compute='_compute_name',
-        store=True,
-        readonly=False,
+        index=True,
         help="Auto-generated name based on linked entities"
     )
 
@@ -127,18 +127,21 @@ class CiRelation(models.Model):
     ci_string_value = fields.Char(
         related='id_ci.string_value',
         string="String Value",
+        store=True,
         readonly=True
     )
 
     ci_integer_value = fields.Integer(
         related='id_ci.integer_value',
         string="Integer Value",
+        store=True,
         readonly=True
     )
 
     ci_boolean_value = fields.Boolean(
         related='id_ci.boolean_value',
         string="Boolean Value",
+        store=True,
         readonly=True
     )
 
@@ -150,51 +153,139 @@ class CiRelation(models.Model):
     )
 
     # =========================================================================
-    # Computed Fields
+    # Indexes
+    # =========================================================================
+
+    # Partial indexes matching the ('isactive', '=', True) filter of the DAO finders
+    _org_ci_active_idx = models.Index('(id_org, id_ci) WHERE isactive')
+    _person_active_idx = models.Index('(id_person) WHERE isactive')
+    _role_active_idx = models.Index('(id_role) WHERE isactive')
+    _period_active_idx = models.Index('(id_period) WHERE isactive')
+
+    # =========================================================================
+    # Name
     # =========================================================================
 
-    @api.depends('id_ci', 'id_person', 'id_role', 'id_org', 'id_period')
-    def _compute_name(self):
+    # Linked entities the name is built from
+    _NAME_FIELDS = ('id_ci', 'id_person', 'id_role', 'id_org', 'id_period')
+
+    # Fields that decide which config item an org lookup resolves to (the name orders them)
+    _CI_LOOKUP_FIELDS = frozenset({'isactive', 'name', *_NAME_FIELDS})
+
+    @api.model
+    def _format_name(self, ci_name=None, person_name=None, first_name=None,
+                     role_name=None, org_name=None, period_name=None) -> str:
         """
-        Compute the name based on linked entities.
+        Format the name of a relation from the names of its linked entities.
 
-        Equivalent to Java: CiRelationServiceImpl.registerOrUpdateCiRelation()
         Format: CI=name.Pn=name-firstname.Ro=name.Or=name_tree.Pd=name
+
+        @param ci_name: Name of the config item, None if not linked
+        @param person_name: Name of the person, None if not linked
+        @param first_name: First name of the person, if any
+        @param role_name: Name of the role, None if not linked
+        @param org_name: Name tree (or name) of the organization, None if not linked
+        @param period_name: Name of the period, None if not linked
+        @return: Name of the relation
         """
-        for record in self:
-            name_parts = []
+        name_parts = []
+        append = name_parts.append
+
+        if ci_name is not None:
+            append("CI=" + ci_name)
 
-            if record.id_ci:
-                name_parts.append(f"CI={record.id_ci.name}")
+        if person_name is not None:
+            if first_name:
+                person_name += "-" + first_name
+            append("Pn=" + person_name)
 
-            if record.id_person:
-                person_name = f"{record.id_person.name or ''}"
-                if hasattr(record.id_person, 'first_name') and record.id_person.first_name:
-                    person_name += f"-{record.id_person.first_name}"
-                elif hasattr(record.id_person, 'firstname') and record.id_person.firstname:
-                    person_name += f"-{record.id_person.firstname}"
-                name_parts.append(f"Pn={person_name}")
+        if role_name is not None:
+            append("Ro=" + role_name)
 
-            if record.id_role:
-                name_parts.append(f"Ro={record.id_role.name or ''}")
+        if org_name is not None:
+            # Use name_tree for org identification (e.g., "int.olvp.bawa")
+            append("Or=" + org_name)
 
-            if record.id_org:
-                # Use name_tree for org identification (e.g., "int.olvp.bawa")
-                org_name = record.id_org.name_tree if hasattr(record.id_org, 'name_tree') and record.id_org.name_tree else record.id_org.name
-                name_parts.append(f"Or={org_name or ''}")
+        if period_name is not None:
+            append("Pd=" + period_name)
 
-            if record.id_period:
-                name_parts.append(f"Pd={record.id_period.name or ''}")
+        # if self.id_sysmodule:
+        #     append("Sm=" + (self.id_sysmodule.name or ''))
 
-            # if record.id_sysmodule:
-            #     name_parts.append(f"Sm={record.id_sysmodule.name or ''}")
+        return '.'.join(name_parts) if name_parts else 'New Relation'
 
-            record.name = '.'.join(name_parts) if name_parts else 'New Relation'
+    def _build_name(self) -> str:
+        """
+        Build the name based on linked entities.
+
+        Equivalent to Java: CiRelationServiceImpl.registerOrUpdateCiRelation()
+        Format: see _format_name
+
+        @return: Name of this relation
+        """
+        self.ensure_one()
+        person_fields = self.env['myschool.person']._fields
+        has_first_name = 'first_name' in person_fields
+        has_firstname = 'firstname' in person_fields
+        has_name_tree = 'name_tree' in self.env['myschool.org']._fields
+
+        config_item, person, role, org, period = (
+            self.id_ci, self.id_person, self.id_role, self.id_org, self.id_period
+        )
+        return self._format_name(
+            ci_name=(config_item.name or '') if config_item else None,
+            person_name=(person.name or '') if person else None,
+            first_name=((has_first_name and person.first_name) or (has_firstname and person.firstname)) if person else None,
+            role_name=(role.name or '') if role else None,
+            org_name=((has_name_tree and org.name_tree) or org.name or '') if org else None,
+            period_name=(period.name or '') if period else None,
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Set the name of new relations from the linked entities, unless given."""
+        unnamed = [vals for vals in vals_list if 'name' not in vals]
+        if unnamed:
+            # Load the linked records of the whole batch at once
+            for field_name in self._NAME_FIELDS:
+                ids = {vals[field_name] for vals in unnamed if vals.get(field_name)}
+                if ids:
+                    self.env[self._fields[field_name].comodel_name].browse(ids).mapped('name')
+            for vals in unnamed:
+                vals['name'] = self.new({
+                    field_name: vals[field_name] for field_name in self._NAME_FIELDS if field_name in vals
+                })._build_name()
+        self.env['myschool.config.item']._clear_ci_value_caches()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        """Rebuild the name when a linked entity changes, unless a name is given."""
+        if not self._CI_LOOKUP_FIELDS.isdisjoint(vals):
+            self.env['myschool.config.item']._clear_ci_value_caches()
+        res = super().write(vals)
+        if 'name' not in vals and any(field_name in vals for field_name in self._NAME_FIELDS):
+            ids_by_name = defaultdict(list)
+            for record in self:
+                ids_by_name[record._build_name()].append(record.id)
+            for name, ids in ids_by_name.items():
+                super(CiRelation, self.browse(ids)).write({'name': name})
+        return res
+
+    def unlink(self):
+        self.env['myschool.config.item']._clear_ci_value_caches()
+        return super().unlink()
 
     # =========================================================================
     # Constraints
     # =========================================================================
 
+    # Unset links are compared as 0, since PostgreSQL treats NULLs as distinct
+    _ci_context_unique = models.UniqueIndex(
+        '(id_ci, COALESCE(id_org, 0), COALESCE(id_person, 0), COALESCE(id_role, 0), COALESCE(id_period, 0))'
+        ' WHERE isactive',
+        'An active relation for this Configuration Item and context already exists!',
+    )
+
     @api.constrains('id_ci')
     def _check_config_item(self):
         """Ensure a config item is always linked."""
@@ -207,29 +298,31 @@ class CiRelation(models.Model):
     # =========================================================================
 
     @api.model
-    def find_by_id(self, relation_id: int) -> Optional['CiRelation']:
+    def find_by_id(self, relation_id: int) -> 'CiRelation':
         """
         Find a CiRelation by ID.
         
         Equivalent to Java: CiRelationServiceImpl.findById()
         
+        Existence is not checked: accessing a field of a deleted relation
+        raises MissingError.
+        
         @param relation_id: ID of the relation
-        @return: CiRelation record or None
+        @return: CiRelation record or empty recordset
         """
-        record = self.browse(relation_id)
-        return record if record.exists() else None
+        return self.browse(int(relation_id)) if relation_id else self.browse()
 
     @api.model
-    def find_by_name(self, name: str) -> Optional['CiRelation']:
+    def find_by_name(self, name: str) -> 'CiRelation':
         """
         Find a CiRelation by name.
         
         Equivalent to Java: CiRelationServiceImpl.findByName()
         
         @param name: Name of the relation
-        @return: CiRelation record or None
+        @return: CiRelation record or empty recordset
         """
-        return self.search([('name', '=', name)], limit=1) or None
+        return self.search([('name', '=', name)], limit=1)
 
     @api.model
     def find_all(self) -> 'CiRelation':
@@ -263,6 +356,14 @@ class CiRelation(models.Model):
         # Create new
         return self.create(vals)
 
+    @api.model
+    def _default_relation_vals(self) -> dict:
+        """Default values for CiRelations created by the service methods."""
+        return {
+            'isactive': True,
+            'automatic_sync': False,
+        }
+
     @api.model
     def create_ci_relation(self) -> 'CiRelation':
         """
@@ -272,10 +373,42 @@ class CiRelation(models.Model):
         
         @return: Created CiRelation
         """
-        return self.create({
-            'isactive': True,
-            'automatic_sync': False,
-        })
+        return self.create(self._default_relation_vals())
+
+    @api.model
+    def create_ci_relations(self, pairs, key: str = 'id_org') -> 'CiRelation':
+        """
+        Create CiRelations linking entities to ConfigItems in one create() call.
+        
+        @param pairs: Iterable of (entity_id, config_item_id) tuples
+        @param key: Relation field of the entity ('id_org', 'id_person', 'id_role' or 'id_period')
+        @return: Recordset of created CiRelations
+        """
+        defaults = self._default_relation_vals()
+        return self.with_context(
+            tracking_disable=True, mail_notrack=True, mail_create_nolog=True,
+        ).create([
+            {key: entity_id, 'id_ci': config_item_id, **defaults}
+            for entity_id, config_item_id in pairs
+        ])
+
+    @api.model
+    def _create_ci_relation_config_item(self, key: str, entity_id: int, config_item_id: int) -> Optional['CiRelation']:
+        """
+        Create a single CiRelation linking an entity to a ConfigItem.
+        
+        @param key: Relation field of the entity
+        @param entity_id: ID of the entity
+        @param config_item_id: ID of the ConfigItem
+        @return: Created CiRelation or None on error
+        """
+        try:
+            # The unique context index may reject the relation; keep the transaction usable
+            with self.env.cr.savepoint():
+                return self.create_ci_relations([(entity_id, config_item_id)], key=key)
+        except Exception as e:
+            _logger.error("Error creating CiRelation: %s", e)
+            return None
 
     @api.model
     def create_ci_relation_org_config_item(self, org_id: int, config_item_id: int) -> Optional['CiRelation']:
@@ -288,16 +421,7 @@ class CiRelation(models.Model):
         @param config_item_id: ID of the ConfigItem
         @return: Created CiRelation or None on error
         """
-        try:
-            return self.create({
-                'id_org': org_id,
-                'id_ci': config_item_id,
-                'isactive': True,
-                'automatic_sync': False,
-            })
-        except Exception as e:
-            _logger.error(f"Error creating CiRelation: {e}")
-            return None
+        return self._create_ci_relation_config_item('id_org', org_id, config_item_id)
 
     @api.model
     def create_ci_relation_person_config_item(self, person_id: int, config_item_id: int) -> Optional['CiRelation']:
@@ -308,16 +432,7 @@ class CiRelation(models.Model):
         @param config_item_id: ID of the ConfigItem
         @return: Created CiRelation or None on error
         """
-        try:
-            return self.create({
-                'id_person': person_id,
-                'id_ci': config_item_id,
-                'isactive': True,
-                'automatic_sync': False,
-            })
-        except Exception as e:
-            _logger.error(f"Error creating CiRelation: {e}")
-            return None
+        return self._create_ci_relation_config_item('id_person', person_id, config_item_id)
 
     @api.model
     def create_ci_relation_role_config_item(self, role_id: int, config_item_id: int) -> Optional['CiRelation']:
@@ -328,16 +443,7 @@ class CiRelation(models.Model):
         @param config_item_id: ID of the ConfigItem
         @return: Created CiRelation or None on error
         """
-        try:
-            return self.create({
-                'id_role': role_id,
-                'id_ci': config_item_id,
-                'isactive': True,
-                'automatic_sync': False,
-            })
-        except Exception as e:
-            _logger.error(f"Error creating CiRelation: {e}")
-            return None
+        return self._create_ci_relation_config_item('id_role', role_id, config_item_id)
 
     @api.model
     def create_ci_relation_period_config_item(self, period_id: int, config_item_id: int) -> Optional['CiRelation']:
@@ -348,32 +454,23 @@ class CiRelation(models.Model):
         @param config_item_id: ID of the ConfigItem
         @return: Created CiRelation or None on error
         """
-        try:
-            return self.create({
-                'id_period': period_id,
-                'id_ci': config_item_id,
-                'isactive': True,
-                'automatic_sync': False,
-            })
-        except Exception as e:
-            _logger.error(f"Error creating CiRelation: {e}")
-            return None
+        return self._create_ci_relation_config_item('id_period', period_id, config_item_id)
 
     # =========================================================================
     # DAO-style Query Methods (from CiRelationDao.java)
     # =========================================================================
 
     @api.model
-    def find_ci_relation_by_org(self, org_id: int) -> Optional['CiRelation']:
+    def find_ci_relation_by_org(self, org_id: int) -> 'CiRelation':
         """
         Find CiRelation by Organization.
         
         Equivalent to Java: CiRelationDao.findCiRelationByIdOrg()
         
         @param org_id: ID of the Organization
-        @return: CiRelation or None
+        @return: CiRelation or empty recordset
         """
-        return self.search([('id_org', '=', org_id), ('isactive', '=', True)], limit=1) or None
+        return self.search([('id_org', '=', org_id), ('isactive', '=', True)], limit=1)
 
     @api.model
     def find_ci_relations_by_org(self, org_id: int) -> 'CiRelation':
@@ -383,19 +480,39 @@ class CiRelation(models.Model):
         @param org_id: ID of the Organization
         @return: Recordset of CiRelations
         """
-        return self.search([('id_org', '=', org_id), ('isactive', '=', True)])
+        return self.browse(self._find_ids_by_org(org_id))
 
     @api.model
-    def find_ci_relation_by_period(self, period_id: int) -> Optional['CiRelation']:
+    def _find_ids_by_org(self, org_id: int) -> tuple:
+        """
+        IDs of the active CiRelations of an Organization, in model order.
+        
+        Plain SQL on the (id_org, id_ci) WHERE isactive index; record rules
+        are not applied.
+        
+        @param org_id: ID of the Organization
+        @return: Tuple of CiRelation IDs
+        """
+        self.flush_model(['id_org', 'isactive', 'name'])
+        self.env.cr.execute(
+            "SELECT id FROM myschool_ci_relation"
+            " WHERE id_org = %s AND isactive"
+            " ORDER BY name, id",
+            (org_id,),
+        )
+        return tuple(row[0] for row in self.env.cr.fetchall())
+
+    @api.model
+    def find_ci_relation_by_period(self, period_id: int) -> 'CiRelation':
         """
         Find CiRelation by Period.
         
         Equivalent to Java: CiRelationDao.findCiRelationByIdPeriod()
         
         @param period_id: ID of the Period
-        @return: CiRelation or None
+        @return: CiRelation or empty recordset
         """
-        return self.search([('id_period', '=', period_id), ('isactive', '=', True)], limit=1) or None
+        return self.search([('id_period', '=', period_id), ('isactive', '=', True)], limit=1)
 
     @api.model
     def find_ci_relations_by_period(self, period_id: int) -> 'CiRelation':
@@ -408,16 +525,16 @@ class CiRelation(models.Model):
         return self.search([('id_period', '=', period_id), ('isactive', '=', True)])
 
     @api.model
-    def find_ci_relation_by_person(self, person_id: int) -> Optional['CiRelation']:
+    def find_ci_relation_by_person(self, person_id: int) -> 'CiRelation':
         """
         Find CiRelation by Person.
         
         Equivalent to Java: CiRelationDao.findCiRelationByIdPerson()
         
         @param person_id: ID of the Person
-        @return: CiRelation or None
+        @return: CiRelation or empty recordset
         """
-        return self.search([('id_person', '=', person_id), ('isactive', '=', True)], limit=1) or None
+        return self.search([('id_person', '=', person_id), ('isactive', '=', True)], limit=1)
 
     @api.model
     def find_ci_relations_by_person(self, person_id: int) -> 'CiRelation':
@@ -430,16 +547,16 @@ class CiRelation(models.Model):
         return self.search([('id_person', '=', person_id), ('isactive', '=', True)])
 
     @api.model
-    def find_ci_relation_by_role(self, role_id: int) -> Optional['CiRelation']:
+    def find_ci_relation_by_role(self, role_id: int) -> 'CiRelation':
         """
         Find CiRelation by Role.
         
         Equivalent to Java: CiRelationDao.findCiRelationByIdRole()
         
         @param role_id: ID of the Role
-        @return: CiRelation or None
+        @return: CiRelation or empty recordset
         """
-        return self.search([('id_role', '=', role_id), ('isactive', '=', True)], limit=1) or None
+        return self.search([('id_role', '=', role_id), ('isactive', '=', True)], limit=1)
 
     @api.model
     def find_ci_relations_by_role(self, role_id: int) -> 'CiRelation':
@@ -462,19 +579,21 @@ class CiRelation(models.Model):
         return self.search([('id_ci', '=', config_item_id), ('isactive', '=', True)])
 
     @api.model
-    def find_ci_relation_by_org_and_config_item_name(self, org_id: int, ci_name: str) -> Optional['CiRelation']:
+    def find_ci_relation_by_org_and_config_item_name(self, org_id: int, ci_name: str) -> 'CiRelation':
         """
         Find CiRelation by Organization and ConfigItem name.
         
         @param org_id: ID of the Organization
         @param ci_name: Name of the ConfigItem
-        @return: CiRelation or None
+        @return: CiRelation or empty recordset
         """
+        # _search() returns a lazy query, inlined as an id subquery on id_ci
+        ci_ids = self.env['myschool.config.item']._search([('name', '=', ci_name)])
         return self.search([
             ('id_org', '=', org_id),
-            ('id_ci.name', '=', ci_name),
+            ('id_ci', 'in', ci_ids),
             ('isactive', '=', True)
-        ], limit=1) or None
+        ], limit=1)
 
     # =========================================================================
     # Helper Methods
@@ -507,33 +626,78 @@ class CiRelation(models.Model):
     def action_update_all_ci_relation_names(self):
         """
         Update names for ALL CI relations in the system.
-        This recalculates the computed name field for all records.
+        Names are rebuilt from one joined query and only stale rows are written.
 
         @return: Notification action with update count
         """
         CiRelation = self.env['myschool.ci.relation']
-
-        # Get all CI relations
-        all_relations = CiRelation.search([])
-
-        updated_count = 0
+        cr = self.env.cr
+
+        # Same optional name fields as _build_name
+        person_fields = self.env['myschool.person']._fields
+        first_name_sql = SQL.identifier('p', 'first_name') if 'first_name' in person_fields else SQL('NULL')
+        firstname_sql = SQL.identifier('p', 'firstname') if 'firstname' in person_fields else SQL('NULL')
+        name_tree_sql = (
+            SQL.identifier('o', 'name_tree') if 'name_tree' in self.env['myschool.org']._fields else SQL('NULL')
+        )
+
+        # Read stored names and the linked names in one query, bypassing the
+        # ORM recompute so only stale rows get written
+        self.env.flush_all()
+        cr.execute(SQL("""
+            SELECT r.id, r.name,
+                   r.id_ci, ci.name,
+                   r.id_person, p.name, %(first_name)s, %(firstname)s,
+                   r.id_role, ro.name,
+                   r.id_org, %(name_tree)s, o.name,
+                   r.id_period, pe.name
+              FROM myschool_ci_relation r
+              LEFT JOIN myschool_config_item ci ON ci.id = r.id_ci
+              LEFT JOIN myschool_person p ON p.id = r.id_person
+              LEFT JOIN myschool_role ro ON ro.id = r.id_role
+              LEFT JOIN myschool_org o ON o.id = r.id_org
+              LEFT JOIN myschool_period pe ON pe.id = r.id_period
+        """, first_name=first_name_sql, firstname=firstname_sql, name_tree=name_tree_sql))
+
+        stale = []
         skipped_count = 0
-
-        for rel in all_relations:
-            try:
-                old_name = rel.name
-                # Trigger recomputation of the name field
-                rel._compute_name()
-                if rel.name != old_name:
-                    updated_count += 1
-                    _logger.debug(f"Updated CI relation {rel.id}: {old_name} -> {rel.name}")
-                else:
-                    skipped_count += 1
-            except Exception as e:
-                _logger.warning(f"Error updating CI relation {rel.id}: {e}")
+        for (rel_id, old_name, ci_id, ci_name, person_id, person_name, first_name, firstname,
+             role_id, role_name, org_id, org_name_tree, org_name,
+             period_id, period_name) in cr.fetchall():
+            new_name = CiRelation._format_name(
+                ci_name=(ci_name or '') if ci_id else None,
+                person_name=(person_name or '') if person_id else None,
+                first_name=first_name or firstname,
+                role_name=(role_name or '') if role_id else None,
+                org_name=(org_name_tree or org_name or '') if org_id else None,
+                period_name=(period_name or '') if period_id else None,
+            )
+
+            if new_name != old_name:
+                stale.append((rel_id, new_name))
+                _logger.debug("Updated CI relation %s: %s -> %s", rel_id, old_name, new_name)
+            else:
                 skipped_count += 1
 
-        _logger.info(f"Updated {updated_count} CI relation names, skipped {skipped_count}")
+        if stale:
+            cr.execute(SQL("""
+                UPDATE myschool_ci_relation
+                   SET name = data.name,
+                       write_uid = %(uid)s,
+                       write_date = NOW() AT TIME ZONE 'UTC'
+                  FROM (VALUES %(values)s) AS data(id, name)
+                 WHERE myschool_ci_relation.id = data.id
+            """,
+                uid=self.env.uid,
+                values=SQL(', ').join(SQL('(%s, %s)', rel_id, name) for rel_id, name in stale),
+            ))
+            CiRelation.invalidate_model(['name', 'write_uid', 'write_date'])
+            # The name orders the relations of the config item lookups
+            self.env['myschool.config.item']._clear_ci_value_caches()
+
+        updated_count = len(stale)
+
+        _logger.info("Updated %s CI relation names, skipped %s", updated_count, skipped_count)
 
         return {
             'type': 'ir.actions.client',
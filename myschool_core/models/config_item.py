@@ -14,13 +14,44 @@ Converted from Java:
 @version: 0.1
 """
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import UserError, ValidationError
 from typing import List, Optional, Any
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Scope: GLOBAL, LOCAL, MODULE, etc.
+SCOPE_SELECTION = [
+    ('global', 'Global'),
+    ('local', 'Local'),
+    ('module', 'Module'),
+    ('org', 'Organization'),
+    ('user', 'User'),
+]
+
+# Type: status, config, setting, parameter, etc.
+TYPE_SELECTION = [
+    ('config', 'Configuration'),
+    ('status', 'Status'),
+    ('setting', 'Setting'),
+    ('parameter', 'Parameter'),
+    ('credential', 'Credential'),
+    ('api', 'API Setting'),
+]
+
+
+def _string_value_vals(value):
+    return {'string_value': str(value), 'integer_value': 0, 'boolean_value': False}
+
+
+# ConfigItem.set_value: write values per exact value type, strings otherwise
+_SET_VALUE_VALS = {
+    bool: lambda value: {'boolean_value': value, 'string_value': False, 'integer_value': 0},
+    int: lambda value: {'integer_value': value, 'string_value': False, 'boolean_value': False},
+    str: _string_value_vals,
+}
+
 
 class ConfigItem(models.Model):
     """
@@ -40,26 +71,21 @@ class ConfigItem(models.Model):
     # Fields (from ConfigItem.java)
     # =========================================================================
 
-    # Scope: GLOBAL, LOCAL, MODULE, etc.
-    scope = fields.Selection([
-        ('global', 'Global'),
-        ('local', 'Local'),
-        ('module', 'Module'),
-        ('org', 'Organization'),
-        ('user', 'User'),
-    ], string="Scope", default='global', index=True,
-       help="Defines where this config item is valid: GLOBAL, LOCAL, MODULE, etc.")
-
-    # Type: status, config, setting, parameter, etc.
-    type = fields.Selection([
-        ('config', 'Configuration'),
-        ('status', 'Status'),
-        ('setting', 'Setting'),
-        ('parameter', 'Parameter'),
-        ('credential', 'Credential'),
-        ('api', 'API Setting'),
-    ], string="Type", default='config', index=True,
-       help="Type of configuration item")
+    scope = fields.Selection(
+        SCOPE_SELECTION,
+        string="Scope",
+        default='global',
+        index=True,
+        help="Defines where this config item is valid: GLOBAL, LOCAL, MODULE, etc."
+    )
+
+    type = fields.Selection(
+        TYPE_SELECTION,
+        string="Type",
+        default='config',
+        index=True,
+        help="Type of configuration item"
+    )
 
     name = fields.Char(
         string="Name", 
@@ -135,8 +161,18 @@ class ConfigItem(models.Model):
             ]):
                 _logger.warning(f"Creating ConfigItem '{vals.get('name')}' without any value set")
         
+        self._clear_ci_value_caches()
         return super().create(vals_list)
 
+    def write(self, vals):
+        if not self._CI_LOOKUP_FIELDS.isdisjoint(vals):
+            self._clear_ci_value_caches()
+        return super().write(vals)
+
+    def unlink(self):
+        self._clear_ci_value_caches()
+        return super().unlink()
+
     # =========================================================================
     # Service Methods (from ConfigItemServiceImpl.java)
     # =========================================================================
@@ -163,7 +199,20 @@ class ConfigItem(models.Model):
         @param name: Name of the config item
         @return: Recordset of matching ConfigItems
         """
-        return self.search([('name', '=', name)])
+        return self.browse(self._find_ids_by_name(name))
+
+    @api.model
+    @tools.ormcache('name')
+    def _find_ids_by_name(self, name: str) -> tuple:
+        """
+        Cached id lookup behind find_by_name.
+        
+        Cleared by _clear_ci_value_caches.
+        
+        @param name: Name of the config item
+        @return: Tuple of ConfigItem IDs
+        """
+        return tuple(self.sudo().search([('name', '=', name)]).ids)
 
     @api.model
     def find_all(self) -> 'ConfigItem':
@@ -200,7 +249,82 @@ class ConfigItem(models.Model):
             return self.create(vals)
 
     @api.model
-    def create_config_item_string(self, name: str, value: str) -> Optional['ConfigItem']:
+    def register_or_update_many(self, vals_list: List[dict]) -> 'ConfigItem':
+        """
+        Register or update several ConfigItems at once.
+        
+        Same matching as register_or_update_config_item (by name), but with
+        one search for all names, one create for the new items and one write
+        per distinct set of values for the existing ones.
+        
+        @param vals_list: List of dictionaries with config item values
+        @return: Recordset of the created or updated ConfigItems, one per name in input order
+        """
+        names = [vals.get('name') for vals in vals_list]
+        if not all(names):
+            raise ValidationError(_("ConfigItem name is required"))
+
+        id_by_name = {}
+        for row in self.search_read([('name', 'in', list(set(names)))], ['name']):
+            id_by_name.setdefault(row['name'], row['id'])
+
+        # Later vals for the same name update the earlier ones
+        create_vals_by_name = {}
+        write_vals_by_id = {}
+        for vals in vals_list:
+            name = vals['name']
+            if name in id_by_name:
+                record_id = id_by_name[name]
+                write_vals_by_id[record_id] = {**write_vals_by_id.get(record_id, {}), **vals}
+            else:
+                create_vals_by_name[name] = {**create_vals_by_name.get(name, {}), **vals}
+
+        ids_by_vals = {}
+        for record_id, vals in write_vals_by_id.items():
+            try:
+                key = tuple(sorted(vals.items()))
+                hash(key)
+            except TypeError:
+                self.browse(record_id).write(vals)
+                continue
+            ids_by_vals.setdefault(key, []).append(record_id)
+
+        for key, ids in ids_by_vals.items():
+            self.browse(ids).write(dict(key))
+
+        if create_vals_by_name:
+            created = self.create(list(create_vals_by_name.values()))
+            id_by_name.update(zip(create_vals_by_name, created.ids))
+
+        return self.browse([id_by_name[name] for name in dict.fromkeys(names)])
+
+    @api.model
+    def _upsert_global_config_item(self, name: str, value_field: str, value) -> 'ConfigItem':
+        """
+        Create a global ConfigItem, or set the value of the existing one.
+        
+        Goes through create/write so that the related CiRelation values are
+        recomputed and the overrides of this model are applied.
+        
+        @param name: Name of the config item
+        @param value_field: 'string_value', 'integer_value' or 'boolean_value'
+        @param value: Value to store
+        @return: Created or updated ConfigItem
+        """
+        config_item = self.search([('name', '=', name), ('scope', '=', 'global')], limit=1)
+        if config_item:
+            if config_item[value_field] != value:
+                config_item.write({value_field: value})
+            return config_item
+        return self.create({
+            'name': name,
+            value_field: value,
+            'type': 'config',
+            'scope': 'global',
+        })
+
+    @api.model
+    def create_config_item_string(self, name: str, value: str) -> 'ConfigItem':
         """
         Create a ConfigItem with a string value.
         
@@ -208,63 +332,171 @@ class ConfigItem(models.Model):
         
         @param name: Name of the config item
         @param value: String value
-        @return: Created ConfigItem or None on error
-        """
-        try:
-            return self.create({
-                'name': name,
-                'string_value': value,
-                'type': 'config',
-                'scope': 'global',
-            })
-        except Exception as e:
-            _logger.error(f"Error creating ConfigItem: {e}")
-            return None
+        @return: Created ConfigItem, or the existing global one with its value updated
+        """
+        return self._upsert_global_config_item(name, 'string_value', value)
 
     @api.model
-    def create_config_item_integer(self, name: str, value: int) -> Optional['ConfigItem']:
+    def create_config_item_integer(self, name: str, value: int) -> 'ConfigItem':
         """
         Create a ConfigItem with an integer value.
         
         @param name: Name of the config item
         @param value: Integer value
-        @return: Created ConfigItem or None on error
-        """
-        try:
-            return self.create({
-                'name': name,
-                'integer_value': value,
-                'type': 'config',
-                'scope': 'global',
-            })
-        except Exception as e:
-            _logger.error(f"Error creating ConfigItem: {e}")
-            return None
+        @return: Created ConfigItem, or the existing global one with its value updated
+        """
+        return self._upsert_global_config_item(name, 'integer_value', value)
 
     @api.model
-    def create_config_item_boolean(self, name: str, value: bool) -> Optional['ConfigItem']:
+    def create_config_item_boolean(self, name: str, value: bool) -> 'ConfigItem':
         """
         Create a ConfigItem with a boolean value.
         
         @param name: Name of the config item
         @param value: Boolean value
-        @return: Created ConfigItem or None on error
-        """
-        try:
-            return self.create({
-                'name': name,
-                'boolean_value': value,
-                'type': 'config',
-                'scope': 'global',
-            })
-        except Exception as e:
-            _logger.error(f"Error creating ConfigItem: {e}")
-            return None
+        @return: Created ConfigItem, or the existing global one with its value updated
+        """
+        return self._upsert_global_config_item(name, 'boolean_value', value)
 
     # =========================================================================
     # DAO-style Query Methods (from ConfigItemDao.java)
     # =========================================================================
 
+    # Transaction cache (env.cr.cache) key of the per-org config item ids
+    _CI_BUNDLE_CACHE_KEY = 'myschool_ci_bundles'
+
+    # Fields that decide which config item a lookup resolves to
+    _CI_LOOKUP_FIELDS = frozenset({'name', 'scope'})
+
+    @api.model
+    def _get_ci_bundle(self, org_short_name: str) -> Optional[dict]:
+        """
+        Get the ids of all config items linked to an organization.
+        
+        The ids are loaded with one query and kept for the rest of the
+        transaction; _clear_ci_value_caches drops them.
+        
+        @param org_short_name: Short name of the organization
+        @return: Dict {ci_name: config item id}, or None if the organization is not found
+        """
+        bundles = self.env.cr.cache.setdefault(self._CI_BUNDLE_CACHE_KEY, {})
+        if org_short_name in bundles:
+            return bundles[org_short_name]
+
+        self.env['myschool.org'].flush_model(['name_short'])
+        self.env['myschool.ci.relation'].flush_model(['id_org', 'id_ci', 'isactive', 'name'])
+        self.flush_model(['name', 'scope'])
+        self.env.cr.execute("""
+            SELECT ci.name, ci.id
+              FROM (
+                    SELECT id FROM myschool_org
+                     WHERE name_short = %s
+                     ORDER BY id
+                     LIMIT 1
+              ) AS org
+              LEFT JOIN myschool_ci_relation rel ON rel.id_org = org.id AND rel.isactive
+              LEFT JOIN myschool_config_item ci ON ci.id = rel.id_ci
+             ORDER BY ci.name, rel.name, ci.scope, ci.id
+        """, (org_short_name,))
+        rows = self.env.cr.fetchall()
+
+        bundle = None
+        if rows:
+            bundle = {}
+            for name, ci_id in rows:
+                if name is not None:
+                    bundle.setdefault(name, ci_id)
+        bundles[org_short_name] = bundle
+        return bundle
+
+    @api.model
+    @tools.ormcache('org_short_name', 'ci_name')
+    def _get_ci_id(self, org_short_name: str, ci_name: str) -> Optional[int]:
+        """
+        Get the id of the ConfigItem used for an organization.
+        
+        The config item linked to the organization via an active CiRelation
+        is preferred; otherwise the first config item with that name is used.
+        Only the id is kept in the ormcache, so changing a value does not
+        require clearing it; _clear_ci_value_caches does when the resolution
+        itself may change.
+        
+        @param org_short_name: Short name of the organization
+        @param ci_name: Name of the config item
+        @return: ConfigItem id, or None if the organization or the config item is not found
+        """
+        bundle = self._get_ci_bundle(org_short_name)
+        if bundle is None:
+            _logger.warning("Organization not found: %s", org_short_name)
+            return None
+
+        if ci_name not in bundle:
+            # Fallback: try to find config item by name only  #todo : behouden ??
+            bundle[ci_name] = self._raw_ci_id(ci_name)
+        return bundle[ci_name]
+
+    @api.model
+    def _raw_ci_id(self, ci_name: str) -> Optional[int]:
+        """
+        Id of the first ConfigItem with a name, in model order.
+        
+        Plain SQL for the internal name-only fallback; access rules are not applied.
+        
+        @param ci_name: Name of the config item
+        @return: ConfigItem id or None
+        """
+        self.flush_model(['name', 'scope'])
+        self.env.cr.execute("""
+            SELECT id
+              FROM myschool_config_item
+             WHERE name = %s
+             ORDER BY scope, name, id
+             LIMIT 1
+        """, (ci_name,))
+        row = self.env.cr.fetchone()
+        return row[0] if row else None
+
+    @api.model
+    def _clear_ci_value_caches(self):
+        """Drop the cached config item lookups (_get_ci_bundle and the ormcaches)."""
+        self.env.cr.cache.pop(self._CI_BUNDLE_CACHE_KEY, None)
+        self.env.registry.clear_cache()
+
+    @api.model
+    def _check_ci_read_access(self):
+        """
+        Check that the current user may read config items, relations and organizations.
+        
+        The lookups read these with plain SQL and share their results between
+        users, so the public getters check access before returning values.
+        """
+        self.check_access('read')
+        self.env['myschool.ci.relation'].check_access('read')
+        self.env['myschool.org'].check_access('read')
+
+    @api.model
+    def get_ci_record_by_org_and_name(self, org_short_name: str, ci_name: str) -> Optional[dict]:
+        """
+        Get all values of a ConfigItem by organization short name and CI name.
+        
+        Callers needing several value types of the same item use this instead
+        of the get_ci_*_by_org_and_name getters.
+        
+        @param org_short_name: Short name of the organization
+        @param ci_name: Name of the config item
+        @return: Dict with string_value, integer_value and boolean_value, or None
+        """
+        self._check_ci_read_access()
+        ci_id = self._get_ci_id(org_short_name, ci_name)
+        if not ci_id:
+            return None
+        config_item = self.browse(ci_id)
+        return {
+            'string_value': config_item.string_value,
+            'integer_value': config_item.integer_value,
+            'boolean_value': config_item.boolean_value,
+        }
+
     @api.model
     def get_ci_value_by_org_and_name(self, org_short_name: str, ci_name: str) -> Optional[str]:
         """
@@ -279,41 +511,8 @@ class ConfigItem(models.Model):
         @param ci_name: Name of the config item
         @return: String value or None
         """
-        # Find via CiRelation
-        CiRelation = self.env.get('myschool.ci.relation')
-        ConfigItem = self.env.get('myschool.config.item')
-        Org = self.env.get('myschool.org')
-        
-        # if not CiRelation or not Org:
-        #     _logger.warning("CiRelation or Org model not found")
-        #     # Fallback: try to find by name only
-        #     config_item = self.search([('name', '=', ci_name)], limit=1)
-        #     return config_item.string_value if config_item else None
-        #
-        # config_item = self.search([('name', '=', ci_name)], limit=1)
-        # SearchConfigItem = config_item.string_value
-        #
-
-
-        # Find the organization
-        org = Org.search([('name_short', '=', org_short_name)], limit=1)
-        if not org:
-            _logger.warning(f"Organization not found: {org_short_name}")
-            return None
-        
-        # Find the CiRelation linking org and config item
-        ci_relation = CiRelation.search([
-            ('id_org', '=', org.id),
-            ('id_ci.name', '=', ci_name),
-            ('isactive', '=', True)
-        ], limit=1)
-        
-        if ci_relation and ci_relation.id_ci:
-            return ci_relation.id_ci.string_value
-        
-        # Fallback: try to find config item by name only  #todo : behouden ??
-        config_item = self.search([('name', '=', ci_name)], limit=1)
-        return config_item.string_value if config_item else None
+        record = self.get_ci_record_by_org_and_name(org_short_name, ci_name)
+        return record['string_value'] if record else None
 
     @api.model
     def get_ci_integer_value_by_org_and_name(self, org_short_name: str, ci_name: str) -> Optional[int]:
@@ -324,28 +523,8 @@ class ConfigItem(models.Model):
         @param ci_name: Name of the config item
         @return: Integer value or None
         """
-        CiRelation = self.env.get('myschool.ci.relation')
-        Org = self.env.get('myschool.org')
-        
-        if not CiRelation or not Org:
-            config_item = self.search([('name', '=', ci_name)], limit=1)
-            return config_item.integer_value if config_item else None
-        
-        org = Org.search([('name_short', '=', org_short_name)], limit=1)
-        if not org:
-            return None
-        
-        ci_relation = CiRelation.search([
-            ('id_org', '=', org.id),
-            ('id_ci.name', '=', ci_name),
-            ('isactive', '=', True)
-        ], limit=1)
-        
-        if ci_relation and ci_relation.id_ci:
-            return ci_relation.id_ci.integer_value
-        
-        config_item = self.search([('name', '=', ci_name)], limit=1)
-        return config_item.integer_value if config_item else None
+        record = self.get_ci_record_by_org_and_name(org_short_name, ci_name)
+        return record['integer_value'] if record else None
 
     @api.model
     def get_ci_boolean_value_by_org_and_name(self, org_short_name: str, ci_name: str) -> Optional[bool]:
@@ -356,28 +535,59 @@ class ConfigItem(models.Model):
         @param ci_name: Name of the config item
         @return: Boolean value or None
         """
-        CiRelation = self.env.get('myschool.ci.relation')
-        Org = self.env.get('myschool.org')
-        
-        if not CiRelation or not Org:
-            config_item = self.search([('name', '=', ci_name)], limit=1)
-            return config_item.boolean_value if config_item else None
-        
-        org = Org.search([('name_short', '=', org_short_name)], limit=1)
-        if not org:
-            return None
-        
-        ci_relation = CiRelation.search([
-            ('id_org', '=', org.id),
-            ('id_ci.name', '=', ci_name),
-            ('isactive', '=', True)
-        ], limit=1)
+        record = self.get_ci_record_by_org_and_name(org_short_name, ci_name)
+        return record['boolean_value'] if record else None
+
+    @api.model
+    def get_ci_values_for_orgs(self, org_short_names: List[str], ci_name: str) -> dict:
+        """
+        Get a ConfigItem string value for several organizations in one query.
         
-        if ci_relation and ci_relation.id_ci:
-            return ci_relation.id_ci.boolean_value
+        Same resolution as get_ci_value_by_org_and_name for each organization:
+        the organization with the lowest id per short name, then its config item.
         
-        config_item = self.search([('name', '=', ci_name)], limit=1)
-        return config_item.boolean_value if config_item else None
+        @param org_short_names: Short names of the organizations
+        @param ci_name: Name of the config item
+        @return: Dict {org_short_name: string value or None}
+        """
+        self._check_ci_read_access()
+        result = dict.fromkeys(org_short_names)
+        if not result:
+            return result
+
+        self.env['myschool.org'].flush_model(['name_short'])
+        self.env['myschool.ci.relation'].flush_model(['id_org', 'id_ci', 'isactive', 'name'])
+        self.flush_model(['name', 'scope'])
+        # Pick the organization first (lowest id per short name), like _get_ci_bundle
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (org.name_short) org.name_short, ci.id
+              FROM (
+                    SELECT DISTINCT ON (name_short) id, name_short
+                      FROM myschool_org
+                     WHERE name_short = ANY(%s)
+                     ORDER BY name_short, id
+              ) AS org
+              LEFT JOIN (myschool_ci_relation rel
+                         JOIN myschool_config_item ci ON ci.id = rel.id_ci AND ci.name = %s)
+                ON rel.id_org = org.id AND rel.isactive
+             ORDER BY org.name_short, rel.name, ci.scope, ci.id
+        """, (list(result), ci_name))
+        ci_id_by_org = dict(self.env.cr.fetchall())
+
+        if not all(ci_id_by_org.values()):
+            # Fallback: try to find config item by name only
+            fallback_id = self._raw_ci_id(ci_name)
+            ci_id_by_org = {
+                org_short_name: ci_id or fallback_id
+                for org_short_name, ci_id in ci_id_by_org.items()
+            }
+
+        # Read the values of all found config items at once
+        config_items = self.browse(list({ci_id for ci_id in ci_id_by_org.values() if ci_id}))
+        value_by_id = dict(zip(config_items.ids, config_items.mapped('string_value')))
+        for org_short_name, ci_id in ci_id_by_org.items():
+            result[org_short_name] = value_by_id[ci_id] if ci_id else None
+        return result
 
     # =========================================================================
     # Helper Methods
@@ -405,17 +615,10 @@ class ConfigItem(models.Model):
         @param value: The value to set
         """
         self.ensure_one()
-        if isinstance(value, bool):
-            self.write({'boolean_value': value, 'string_value': False, 'integer_value': 0})
-        elif isinstance(value, int):
-            self.write({'integer_value': value, 'string_value': False, 'boolean_value': False})
-        else:
-            self.write({'string_value': str(value), 'integer_value': 0, 'boolean_value': False})
+        self.write(_SET_VALUE_VALS.get(type(value), _string_value_vals)(value))
 
-    def name_get(self):
+    @api.depends('scope', 'name')
+    def _compute_display_name(self):
         """Custom name display including scope."""
-        result = []
         for record in self:
-            name = f"[{record.scope or 'global'}] {record.name}"
-            result.append((record.id, name))
-        return result
+            record.display_name = f"[{record.scope or 'global'}] {record.name}"
@@ -21,8 +21,27 @@ from datetime import date, datetime
 from typing import List, Optional, Dict, Any
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_loads(json_str):
+    """Decode JSON with orjson when installed, the standard library otherwise."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+def _json_dumps(obj) -> str:
+    """Encode JSON to a string with orjson when installed, the standard library otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+@dataclass(slots=True)
 class InschrKlassen:
     """
     Class registration information.
@@ -47,7 +66,19 @@ class InschrKlassen:
         )
 
 
-@dataclass
+def _klas_to_dict(klas: InschrKlassen) -> Dict[str, Any]:
+    """Convert an InschrKlassen to its BeTask JSON dictionary."""
+    return {
+        'klas': klas.klas,
+        'groepType': klas.groep_type,
+        'klasCode': klas.klas_code,
+        'einddatum': klas.einddatum,
+        'begindatum': klas.begindatum,
+        'klasnummer': klas.klasnummer,
+    }
+
+
+@dataclass(slots=True)
 class Relations:
     """
     Student relation information (parents, guardians, etc.).
@@ -75,7 +106,7 @@ class Relations:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """
     Address information.
@@ -103,7 +134,7 @@ class Address:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Registration:
     """
     Student registration data.
@@ -117,6 +148,11 @@ class Registration:
     reg_end_date: Optional[str] = None
     reg_group_code: str = ''
     reg_inst_nr: str = ''
+    _active_class: Optional[InschrKlassen] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolved once; inschr_klassen is not modified after parsing
+        self._active_class = next((k for k in self.inschr_klassen if k.einddatum is None), None)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Registration':
@@ -137,13 +173,10 @@ class Registration:
     
     def get_active_class(self) -> Optional[InschrKlassen]:
         """Get the currently active class (where einddatum is None)."""
-        for klas in self.inschr_klassen:
-            if klas.einddatum is None:
-                return klas
-        return None
+        return self._active_class
 
 
-@dataclass
+@dataclass(slots=True)
 class Students:
     """
     Student details data.
@@ -181,7 +214,7 @@ class Students:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     """
     Employee data from Informat.
@@ -217,7 +250,7 @@ class Employee:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignments:
     """
     Employee assignment data.
@@ -246,7 +279,7 @@ class Assignments:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonJSON:
     """
     Person data structure for BeTask JSON.
@@ -304,44 +337,34 @@ class PersonJSON:
             'regEndDate': self.reg_end_date,
             'regGroupCode': self.reg_group_code,
             'regInstNr': self.reg_inst_nr,
-            'inschrKlassen': [
-                {
-                    'klas': k.klas,
-                    'groepType': k.groep_type,
-                    'klasCode': k.klas_code,
-                    'einddatum': k.einddatum,
-                    'begindatum': k.begindatum,
-                    'klasnummer': k.klasnummer
-                }
-                for k in self.inschr_klassen
-            ]
+            'inschrKlassen': list(map(_klas_to_dict, self.inschr_klassen)),
         }
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
 
 # Helper functions for JSON parsing
 def parse_registration(json_str: str) -> Registration:
     """Parse JSON string to Registration object."""
-    data = json.loads(json_str)
+    data = _json_loads(json_str)
     return Registration.from_dict(data)
 
 
 def parse_student(json_str: str) -> Students:
     """Parse JSON string to Students object."""
-    data = json.loads(json_str)
+    data = _json_loads(json_str)
     return Students.from_dict(data)
 
 
 def parse_employee(json_str: str) -> Employee:
     """Parse JSON string to Employee object."""
-    data = json.loads(json_str)
+    data = _json_loads(json_str)
     return Employee.from_dict(data)
 
 
 def parse_assignment(json_str: str) -> Assignments:
     """Parse JSON string to Assignments object."""
-    data = json.loads(json_str)
+    data = _json_loads(json_str)
     return Assignments.from_dict(data)
@@ -15,20 +15,84 @@ Converted from Java syncsapImpl.java for myschool-core application.
 @since: 2025-02-04
 """
 
-import json
+import hashlib
 import logging
 import os
+import time
 import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
 
+from .informat_dto import _json_dumps, _json_loads
+
 _logger = logging.getLogger(__name__)
 
+_SESSION = None
+
+# Size of the chunks in which API responses are streamed to disk
+_DOWNLOAD_CHUNK_SIZE = 65536
+
+# Bearer tokens per org short name: (api_id, access_token, monotonic expiry)
+_TOKEN_CACHE: Dict[str, tuple] = {}
+
+# Seconds before the announced expiry at which a cached token is renewed
+_TOKEN_EXPIRY_MARGIN = 30
+
+
+def _http_session() -> requests.Session:
+    """Return the keep-alive HTTP session shared by all Informat API calls."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        ))
+        session.headers['Accept'] = 'application/json'
+        _SESSION = session
+    return _SESSION
+
+
+def _download_to_file(url: str, headers: dict, file_path: str) -> tuple:
+    """
+    Stream a GET response into file_path without holding the body in memory.
+
+    The body is written to a temporary file that only replaces file_path once
+    the download is complete. Empty bodies ('' or '[]') are not kept.
+
+    @return: (status_code, file_path), file_path being None when nothing was stored
+    """
+    tmp_path = f"{file_path}.part"
+    with _http_session().get(url, headers=headers, stream=True, timeout=60) as response:
+        if response.status_code != 200:
+            return response.status_code, None
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        except Exception:
+            # Do not leave a partial download in the storage directory
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    if os.path.getsize(tmp_path) <= 16:
+        with open(tmp_path, 'rb') as f:
+            if f.read().strip() in (b'', b'[]'):
+                os.remove(tmp_path)
+                return 200, None
+    os.replace(tmp_path, file_path)
+    return 200, file_path
+
 
 class InformatService(models.AbstractModel):
     """
@@ -57,6 +121,23 @@ class InformatService(models.AbstractModel):
     EMPLOYEES_API_URL = 'https://personeelsapi.informatsoftware.be/employees'
     EMPLOYEE_ASSIGNMENTS_API_URL = 'https://personeelsapi.informatsoftware.be/employees/assignments'
 
+    # Maximum number of schools fetched from the API at the same time
+    API_MAX_WORKERS = 8
+
+    # Prefix of the config items holding the payload digest of each sync phase
+    PAYLOAD_DIGEST_CI_PREFIX = 'SapSyncHash'
+    # ConfigItem with the phases completed by the last unfinished sync run
+    RUN_STATE_CI_NAME = 'SapSyncRunState'
+
+    # Transaction cache (env.cr.cache) keys of the resolved storage paths
+    # and of the timestamp suffix shared by all files stored in one run
+    _STORAGE_PATH_CACHE_KEY = 'myschool_informat_storage_paths'
+    _FILE_SUFFIX_CACHE_KEY = 'myschool_informat_file_suffix'
+
+    # Transaction cache (env.cr.cache) key of the BeTask vals waiting to be
+    # created in one batch; only present while execute_sync runs
+    _BETASK_BATCH_CACHE_KEY = 'myschool_informat_betask_batch'
+
     # =========================================================================
     # BeTask Configuration - ADJUST THESE TO MATCH YOUR MODEL!
     # =========================================================================
@@ -124,6 +205,22 @@ class InformatService(models.AbstractModel):
     def _get_storage_path(self, dev_mode: bool = False) -> str:
         """
         Get the appropriate storage path based on mode.
+
+        The path is resolved once per transaction; the Informat service
+        configuration clears the cache when it changes.
+
+        @param dev_mode: If True, return dev path; if False, return prod path
+        @return: Absolute path to storage directory
+        """
+        dev_mode = bool(dev_mode)
+        paths = self.env.cr.cache.setdefault(self._STORAGE_PATH_CACHE_KEY, {})
+        if dev_mode not in paths:
+            paths[dev_mode] = self._resolve_storage_path(dev_mode)
+        return paths[dev_mode]
+
+    def _resolve_storage_path(self, dev_mode: bool = False) -> str:
+        """
+        Resolve the storage path for a mode from the configuration.
         
         For development mode:
             - Uses module directory: {module_path}/storage/sapimport/dev
@@ -158,7 +255,7 @@ class InformatService(models.AbstractModel):
                         else:
                             return os.path.join(self._get_odoo_data_dir(), custom_path)
         except Exception as e:
-            _logger.warning(f"Could not load storage path from config: {e}")
+            _logger.warning("Could not load storage path from config: %s", e)
         
         # Fall back to default paths
         if dev_mode:
@@ -197,17 +294,30 @@ class InformatService(models.AbstractModel):
             ]
             
             for directory in directories:
-                if not os.path.exists(directory):
-                    os.makedirs(directory, exist_ok=True)
-                    _logger.info(f"Created storage directory: {directory}")
+                try:
+                    os.makedirs(directory)
+                except FileExistsError:
+                    continue
+                _logger.info("Created storage directory: %s", directory)
             
             return True
             
         except OSError as e:
-            _logger.error(f"Failed to create storage directories: {e}")
+            _logger.error("Failed to create storage directories: %s", e)
             self._create_sys_error("SAPSYNC-900", f"Failed to create storage directories: {e}")
             return False
 
+    def _get_run_file_suffix(self) -> str:
+        """
+        Get the timestamp suffix of the files stored during this sync run.
+
+        @return: Suffix like '20250204123000.json', the same for the whole transaction
+        """
+        cache = self.env.cr.cache
+        if self._FILE_SUFFIX_CACHE_KEY not in cache:
+            cache[self._FILE_SUFFIX_CACHE_KEY] = datetime.now().strftime('%Y%m%d%H%M%S.json')
+        return cache[self._FILE_SUFFIX_CACHE_KEY]
+
     def _get_file_path(self, filename: str, dev_mode: bool = False, is_student: bool = False) -> str:
         """
         Get the full file path for a storage file.
@@ -286,6 +396,22 @@ class InformatService(models.AbstractModel):
             if self._check_blocking_tasks():
                 return False
 
+            # Collect the BeTasks of each analysis pass and create them together
+            self._start_betask_batch()
+
+            # Schools are looked up once and shared by all retrievals of this run
+            schools = self._get_informat_schools()
+
+            # Per-school payload digests, used to skip phases whose input is unchanged
+            skip_unchanged = config.skip_unchanged_payloads
+            # Phases completed by an earlier, unfinished run are not analyzed again
+            run_state = self._load_run_state()
+            run_complete = True
+            assignment_digests: Dict[str, str] = {}
+            employee_digests: Dict[str, str] = {}
+            registration_digests: Dict[str, str] = {}
+            student_digests: Dict[str, str] = {}
+
             # =====================================================
             # PHASE 1a: Role Processing
             # =====================================================
@@ -294,7 +420,9 @@ class InformatService(models.AbstractModel):
 
             if config.sync_roles or config.sync_employees:
                 # Assignments are needed for both roles and employees
-                all_imported_employee_assignments = self._get_employee_assignments_from_informat(dev_mode)
+                all_imported_employee_assignments = self._get_employee_assignments_from_informat(
+                    dev_mode, assignment_digests, schools
+                )
 
                 if all_imported_employee_assignments is None:
                     self._create_sys_error("SAPSYNC-900", "Error in getEmployeeAssignmentsFromInformat")
@@ -302,27 +430,52 @@ class InformatService(models.AbstractModel):
                     self._create_sys_event("SAPSYNC-001", f"Loaded {len(all_imported_employee_assignments)} employee assignments")
 
             if config.sync_roles and all_imported_employee_assignments is not None:
-                self._analyze_employee_assignments_and_create_roles(all_imported_employee_assignments)
-                self._process_betasks('DB', 'ROLE', 'ADD')
-                self._process_betasks('DB', 'ROLE', 'UPD')
+                roles_digest = self._combine_payload_digests(assignment_digests)
+                if self._is_phase_done('Roles', roles_digest, skip_unchanged, run_state):
+                    self._create_sys_event("SAPSYNC-001", "Employee assignments unchanged, role analysis skipped")
+                    roles_analyzed = True
+                else:
+                    roles_analyzed = self._analyze_employee_assignments_and_create_roles(all_imported_employee_assignments)
+                # Pending tasks of an interrupted run are processed even when the analysis is skipped
+                roles_processed = self._process_betask_actions('DB', 'ROLE', ('ADD', 'UPD'))
+                if roles_analyzed and roles_processed:
+                    self._complete_phase('Roles', roles_digest, run_state)
+                else:
+                    run_complete = False
 
             # =====================================================
             # PHASE 1b: Employee Processing
             # =====================================================
 
             if config.sync_employees:
-                all_imported_employees = self._get_employees_from_informat('', dev_mode)
+                all_imported_employees = self._get_employees_from_informat('', dev_mode, employee_digests, schools)
 
                 if all_imported_employees is None:
                     self._create_sys_error("SAPSYNC-900", "Error in getEmployeesFromInformat")
                     return False
 
+                # Pension dates are checked against today, so the run date is part of the digest
+                employees_digest = self._combine_payload_digests(
+                    employee_digests, assignment_digests,
+                    {'run_date': datetime.now().date().isoformat()}
+                )
+                employees_unchanged = self._is_phase_done('Employees', employees_digest, skip_unchanged, run_state)
+                if employees_unchanged:
+                    self._create_sys_event("SAPSYNC-001", "Employee data unchanged, employee analysis skipped")
+
+                employee_processing_results = []
                 if not self._sync_employees(
                     all_imported_employees,
-                    all_imported_employee_assignments
+                    all_imported_employee_assignments,
+                    analyze=not employees_unchanged,
+                    processing_results=employee_processing_results
                 ):
                     self._create_sys_error("SAPSYNC-900", "Error in _sync_employees")
                     return False
+                if all(employee_processing_results):
+                    self._complete_phase('Employees', employees_digest, run_state)
+                else:
+                    run_complete = False
 
             # =====================================================
             # PHASE 2a: Class (Org) Processing
@@ -333,23 +486,31 @@ class InformatService(models.AbstractModel):
 
             if config.sync_classes or config.sync_students:
                 # Registrations are needed for both classes and students
-                all_imported_registrations = self._get_registrations_from_informat('', dev_mode)
+                all_imported_registrations = self._get_registrations_from_informat('', dev_mode, registration_digests, schools)
 
                 if all_imported_registrations is None:
                     self._create_sys_error("SAPSYNC-900", "Error in getRegistrationsFromInformat")
                     return False
 
             if config.sync_classes and all_imported_registrations is not None:
-                self._analyze_student_data_and_create_org_tasks(all_imported_registrations)
-                self._process_betasks('DB', 'ORG', 'ADD')
-                self._process_betasks('DB', 'ORG', 'UPD')
+                classes_digest = self._combine_payload_digests(registration_digests)
+                if self._is_phase_done('Classes', classes_digest, skip_unchanged, run_state):
+                    self._create_sys_event("SAPSYNC-001", "Registrations unchanged, class analysis skipped")
+                    classes_analyzed = True
+                else:
+                    classes_analyzed = self._analyze_student_data_and_create_org_tasks(all_imported_registrations)
+                classes_processed = self._process_betask_actions('DB', 'ORG', ('ADD', 'UPD'))
+                if classes_analyzed and classes_processed:
+                    self._complete_phase('Classes', classes_digest, run_state)
+                else:
+                    run_complete = False
 
             # =====================================================
             # PHASE 2b: Student Processing
             # =====================================================
 
             if config.sync_students:
-                all_imported_students = self._get_students_from_informat('', '', dev_mode)
+                all_imported_students = self._get_students_from_informat('', '', dev_mode, student_digests, schools)
 
                 if all_imported_students is None:
                     self._create_sys_error("SAPSYNC-900", "Error in getStudentsFromInformat")
@@ -357,9 +518,19 @@ class InformatService(models.AbstractModel):
 
                 # Process Students (needs registrations too)
                 if all_imported_registrations is not None:
-                    self._analyze_data_and_create_student_tasks(all_imported_registrations, all_imported_students)
-                    self._process_betasks('DB', 'PERSON', 'ADD')
-                    self._process_betasks('DB', 'PERSON', 'UPD')
+                    students_digest = self._combine_payload_digests(registration_digests, student_digests)
+                    if self._is_phase_done('Students', students_digest, skip_unchanged, run_state):
+                        self._create_sys_event("SAPSYNC-001", "Student data unchanged, student analysis skipped")
+                        students_analyzed = True
+                    else:
+                        students_analyzed = self._analyze_data_and_create_student_tasks(
+                            all_imported_registrations, all_imported_students
+                        )
+                    students_processed = self._process_betask_actions('DB', 'PERSON', ('ADD', 'UPD'))
+                    if students_analyzed and students_processed:
+                        self._complete_phase('Students', students_digest, run_state)
+                    else:
+                        run_complete = False
 
 
 
@@ -370,6 +541,9 @@ class InformatService(models.AbstractModel):
 
 
 
+            if run_complete:
+                # A full run starts from scratch next time
+                self._clear_run_state()
             self._create_sys_event("SAPSYNC", "All tasks processed without errors")
             return True
             
@@ -377,6 +551,9 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("SAPSYNC-900", f"Executesync error: {traceback.format_exc()}")
             return False
 
+        finally:
+            self._end_betask_batch()
+
     @api.model
     def execute_diff_sync(self, dev_mode: bool = False) -> bool:
         """
@@ -418,6 +595,100 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("SAPSYNC-900", f"ExecuteDiffSync error: {traceback.format_exc()}")
             return False
 
+    # =========================================================================
+    # Payload Change Detection
+    # =========================================================================
+
+    def _combine_payload_digests(self, *digest_maps: Dict[str, str]) -> str:
+        """
+        Combine per-school payload digests into a single digest for a sync phase.
+        
+        @param digest_maps: Dicts with institution number as key and payload digest as value
+        @return: Hex digest covering all given payloads
+        """
+        combined = hashlib.blake2b(digest_size=16)
+        for digests in digest_maps:
+            for institution_number, digest in sorted(digests.items()):
+                combined.update(f"{institution_number}={digest};".encode())
+            combined.update(b'|')
+        return combined.hexdigest()
+
+    def _is_payload_unchanged(self, phase: str, digest: str) -> bool:
+        """
+        Check whether a sync phase already processed exactly this payload.
+        
+        @param phase: Name of the sync phase (e.g. 'Employees')
+        @param digest: Combined payload digest of the current run
+        @return: True if the last completed run of the phase stored the same digest
+        """
+        config_item = self.env['myschool.config.item'].find_by_name(
+            f"{self.PAYLOAD_DIGEST_CI_PREFIX}{phase}"
+        )[:1]
+        return bool(config_item) and config_item.string_value == digest
+
+    def _store_payload_digest(self, phase: str, digest: str) -> None:
+        """
+        Remember the payload digest of a completed sync phase.
+        
+        @param phase: Name of the sync phase (e.g. 'Employees')
+        @param digest: Combined payload digest of the current run
+        """
+        self.env['myschool.config.item'].create_config_item_string(
+            f"{self.PAYLOAD_DIGEST_CI_PREFIX}{phase}", digest
+        )
+
+    def _load_run_state(self) -> Dict[str, str]:
+        """
+        Load the phases completed by the last unfinished sync run.
+        
+        @return: Dict with the phase name as key and its payload digest as value
+        """
+        config_item = self.env['myschool.config.item'].find_by_name(self.RUN_STATE_CI_NAME)[:1]
+        if not config_item or not config_item.string_value:
+            return {}
+        try:
+            run_state = _json_loads(config_item.string_value)
+        except ValueError:
+            run_state = None
+        if not isinstance(run_state, dict):
+            _logger.warning("Ignoring unreadable sync run state: %s", config_item.string_value)
+            return {}
+        return run_state
+
+    def _is_phase_done(self, phase: str, digest: str, skip_unchanged: bool, run_state: Dict[str, str]) -> bool:
+        """
+        Check whether the analysis of a sync phase can be skipped.
+        
+        @param phase: Name of the sync phase (e.g. 'Employees')
+        @param digest: Combined payload digest of the current run
+        @param skip_unchanged: Whether phases with an unchanged payload are skipped
+        @param run_state: Phases completed by the last unfinished run (see _load_run_state)
+        @return: True if an unfinished run, or with skip_unchanged the last completed
+                 run, already processed exactly this payload
+        """
+        if run_state.get(phase) == digest:
+            return True
+        return skip_unchanged and self._is_payload_unchanged(phase, digest)
+
+    def _complete_phase(self, phase: str, digest: str, run_state: Dict[str, str]) -> None:
+        """
+        Record a completed sync phase in the payload digests and the run state.
+        
+        @param phase: Name of the sync phase (e.g. 'Employees')
+        @param digest: Combined payload digest of the current run
+        @param run_state: Run state of the current run, updated in place
+        """
+        self._store_payload_digest(phase, digest)
+        run_state[phase] = digest
+        self.env['myschool.config.item'].create_config_item_string(
+            self.RUN_STATE_CI_NAME, _json_dumps(run_state)
+        )
+
+    def _clear_run_state(self) -> None:
+        """Forget the completed phases once a sync run has completed every phase."""
+        if self._load_run_state():
+            self.env['myschool.config.item'].create_config_item_string(self.RUN_STATE_CI_NAME, '{}')
+
     # =========================================================================
     # Data Retrieval Methods
     # =========================================================================
@@ -425,6 +696,9 @@ class InformatService(models.AbstractModel):
     def _get_bearer_token(self, org_short_name: str = 'olvp') -> Optional[str]:
         """
         Retrieve OAuth2 Bearer token from identity server.
+
+        The token is cached per org until shortly before its expires_in,
+        so consecutive getters in one sync share a single token request.
         
         @param org_short_name: Short name of the organization
         @return: Bearer token string or None if failed
@@ -438,8 +712,12 @@ class InformatService(models.AbstractModel):
             if not api_id or not api_password:
                 _logger.error("API credentials not found in config items")
                 return None
+
+            cached = _TOKEN_CACHE.get(org_short_name)
+            if cached and cached[0] == api_id and time.monotonic() < cached[2] - _TOKEN_EXPIRY_MARGIN:
+                return cached[1]
             
-            response = requests.post(
+            response = _http_session().post(
                 self.IDENTITY_SERVER_URL,
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
                 data={
@@ -451,17 +729,64 @@ class InformatService(models.AbstractModel):
             )
             
             if response.status_code != 200:
-                _logger.error(f"Problem retrieving Bearer token: {response.status_code}")
+                _logger.error("Problem retrieving Bearer token: %s", response.status_code)
                 return None
             
-            token_data = response.json()
-            return token_data.get('access_token')
+            token_data = _json_loads(response.content)
+            access_token = token_data.get('access_token')
+            if access_token and token_data.get('expires_in'):
+                _TOKEN_CACHE[org_short_name] = (
+                    api_id, access_token, time.monotonic() + float(token_data['expires_in'])
+                )
+            return access_token
             
         except Exception as e:
-            _logger.error(f"Error getting bearer token: {e}")
+            _logger.error("Error getting bearer token: %s", e)
             return None
 
-    def _get_registrations_from_informat(self, timestamp: str, dev_mode: bool) -> Optional[Dict[str, str]]:
+    def _invalidate_bearer_token(self, org_short_name: str = 'olvp') -> None:
+        """
+        Drop the cached Bearer token, e.g. after the API rejected it with a 401.
+
+        @param org_short_name: Short name of the organization
+        """
+        _TOKEN_CACHE.pop(org_short_name, None)
+
+    def _get_informat_schools(self):
+        """
+        Get all schools with INFORMAT as SAP provider.
+        
+        @return: Recordset of myschool.org
+        """
+        return self.env['myschool.org'].search([('sap_provider', '=', '1')])  #todo: was INFORMAT - how to use string iso index
+
+    def _fetch_school_responses(self, school_requests: List[tuple]) -> Dict[int, Any]:
+        """
+        Download the per-school API responses concurrently, each into its own file.
+
+        Only the HTTP calls and file writes run in worker threads. The caller
+        parses the files and logs SysEvents on the main thread, so the cursor
+        and environment are never used from a worker.
+
+        @param school_requests: List of (school_id, url, headers, file_path) tuples
+        @return: Dict with school_id as key and the Future of its
+                 (status_code, file_path) result as value
+        """
+        if not school_requests:
+            return {}
+        for directory in {os.path.dirname(req[3]) for req in school_requests}:
+            os.makedirs(directory, exist_ok=True)
+        _http_session()
+        max_workers = min(self.API_MAX_WORKERS, len(school_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return {
+                school_id: executor.submit(_download_to_file, url, headers, file_path)
+                for school_id, url, headers, file_path in school_requests
+            }
+
+    def _get_registrations_from_informat(self, timestamp: str, dev_mode: bool,
+                                         digests: Optional[Dict[str, str]] = None,
+                                         schools=None) -> Optional[Dict[str, dict]]:
         """
         Retrieve Student Registration information from Informat.
         
@@ -469,10 +794,14 @@ class InformatService(models.AbstractModel):
         
         @param timestamp: Retrieve changes after this timestamp
         @param dev_mode: Use local files if True
-        @return: Dict with persoonId as key and JSON string as value, or None on error
+        @param digests: Optional dict filled with a content digest of each school's payload
+        @param schools: Schools to import, defaults to all schools with Informat as SAP provider
+        @return: Dict with persoonId as key and parsed JSON dict as value, or None on error
         """
         procedure_name = '_get_registrations_from_informat'
-        all_registrations: Dict[str, str] = {}
+        all_registrations: Dict[str, dict] = {}
+        # Per-school SysEvents, created in one batch when the retrieval ends
+        events: List[tuple] = []
         
         self._create_sys_event("SAPSYNC-001", "Start importing Registration information")
         
@@ -489,14 +818,26 @@ class InformatService(models.AbstractModel):
                 if not bearer_token:
                     return None
             
-            # Get all schools with INFORMAT as SAP provider
-            Org = self.env['myschool.org']
-            schools = Org.search([('sap_provider', '=', '1')])
+            if schools is None:
+                schools = self._get_informat_schools()
+
+            responses = {}
+            if not dev_mode:
+                file_suffix = self._get_run_file_suffix()
+                responses = self._fetch_school_responses([
+                    (school.id,
+                     f"{self.STUDENTS_API_URL}/registrations?schoolYear={current_school_year}{timestamp_string}",
+                     {
+                         'Authorization': f'Bearer {bearer_token}',
+                         'InstituteNo': school.inst_nr,
+                     },
+                     self._get_file_path(f"registrations-{school.inst_nr}-{file_suffix}", dev_mode=False))
+                    for school in schools
+                ])
             
             for school in schools:
-                self._create_sys_event("SAPSYNC-001", f"Start importing data for {school.inst_nr}")
+                events.append(("SAPSYNC-001", f"Start importing data for {school.inst_nr}"))
                 
-                file_suffix = datetime.now().strftime('%Y%m%d%H%M%S.json')
                 institution_number = school.inst_nr
                 
                 if dev_mode:
@@ -506,55 +847,48 @@ class InformatService(models.AbstractModel):
                         dev_mode=True,
                         is_student=True
                     )
-                    registrations_data = self._read_json_file(json_file_path)
+                    registrations_data = self._read_json_file(json_file_path, digests, institution_number)
                     
                     if registrations_data:
-                        for registration in registrations_data:
-                            persoon_id = registration.get('persoonId')
-                            if persoon_id:
-                                all_registrations[persoon_id] = json.dumps(registration)
+                        all_registrations.update({
+                            registration['persoonId']: registration
+                            for registration in registrations_data if registration.get('persoonId')
+                        })
                     else:
-                        self._create_sys_event("SAPSYNC-900", f"File not found: {json_file_path}")
+                        events.append(("SAPSYNC-900", f"File not found: {json_file_path}"))
                 else:
-                    # Fetch from API
-                    json_file_path = self._get_file_path(
-                        f"registrations-{institution_number}-{file_suffix}",
-                        dev_mode=False
-                    )
+                    # Fetch from API (streamed to json_file_path by the worker)
+                    status_code, json_file_path = responses[school.id].result()
                     
-                    response = requests.get(
-                        f"{self.STUDENTS_API_URL}/registrations?schoolYear={current_school_year}{timestamp_string}",
-                        headers={
-                            'Authorization': f'Bearer {bearer_token}',
-                            'InstituteNo': institution_number,
-                            'Accept': 'application/json'
-                        },
-                        timeout=60
-                    )
-                    
-                    if response.status_code != 200:
+                    if status_code != 200:
+                        if status_code == 401:
+                            self._invalidate_bearer_token()
+                        # Keep the buffered events ahead of the error in the log
+                        self._create_sys_events(events)
+                        events.clear()
                         self._create_sys_error("BETASK-900", f"{procedure_name}: Problem retrieving Registration Data")
                         continue
                     
-                    if response.text and response.text != '[]':
-                        # Write to file
-                        self._write_json_file(json_file_path, response.text)
-                        
+                    if json_file_path:
                         # Parse and add to results
-                        registrations_data = response.json()
-                        for registration in registrations_data:
-                            persoon_id = registration.get('persoonId')
-                            if persoon_id:
-                                all_registrations[persoon_id] = json.dumps(registration)
+                        registrations_data = self._load_json_file(json_file_path, digests, institution_number)
+                        all_registrations.update({
+                            registration['persoonId']: registration
+                            for registration in registrations_data if registration.get('persoonId')
+                        })
             
-            self._create_sys_event("SAPSYNC-001", "Registrations retrieved successfully")
+            events.append(("SAPSYNC-001", "Registrations retrieved successfully"))
+            self._create_sys_events(events)
             return all_registrations
             
         except Exception as e:
+            self._create_sys_events(events)
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return None
 
-    def _get_students_from_informat(self, timestamp: str, student_id: str, dev_mode: bool) -> Optional[Dict[str, str]]:
+    def _get_students_from_informat(self, timestamp: str, student_id: str, dev_mode: bool,
+                                    digests: Optional[Dict[str, str]] = None,
+                                    schools=None) -> Optional[Dict[str, dict]]:
         """
         Retrieve Student data from SAP Informat for all orgs where SAP = 1.
         
@@ -563,10 +897,14 @@ class InformatService(models.AbstractModel):
         @param timestamp: Return students changed after this moment
         @param student_id: If specified, retrieve data for specific student
         @param dev_mode: Use local files if True
-        @return: Dict with persoonId as key and JSON string as value, or None on error
+        @param digests: Optional dict filled with a content digest of each school's payload
+        @param schools: Schools to import, defaults to all schools with Informat as SAP provider
+        @return: Dict with persoonId as key and parsed JSON dict as value, or None on error
         """
         procedure_name = '_get_students_from_informat'
-        all_students: Dict[str, str] = {}
+        all_students: Dict[str, dict] = {}
+        # Per-school SysEvents, created in one batch when the retrieval ends
+        events: List[tuple] = []
         
         self._create_sys_event("BETASK-001", f"{procedure_name} started")
         
@@ -584,17 +922,29 @@ class InformatService(models.AbstractModel):
             ConfigItem = self.env['myschool.config.item']
             current_school_year = ConfigItem.get_ci_value_by_org_and_name('olvp', 'CurrentSchoolYear')
             
-            # Get all schools with INFORMAT as SAP provider
-            Org = self.env['myschool.org']
-            schools = Org.search([('sap_provider', '=', '1')])
+            if schools is None:
+                schools = self._get_informat_schools()
+
+            responses = {}
+            if not dev_mode:
+                file_suffix = self._get_run_file_suffix()
+                responses = self._fetch_school_responses([
+                    (school.id,
+                     f"{self.STUDENTS_API_URL}{student_id_string}?schoolYear={current_school_year}{timestamp_string}",
+                     {
+                         'Authorization': f'Bearer {bearer_token}',
+                         'InstituteNo': school.inst_nr,
+                     },
+                     self._get_file_path(f"students-{school.inst_nr}-{file_suffix}", dev_mode=False))
+                    for school in schools
+                ])
             
             for school in schools:
-                _logger.info(f"Start importing student data for {school.inst_nr}")
+                _logger.info("Start importing student data for %s", school.inst_nr)
                 
-                file_suffix = datetime.now().strftime('%Y%m%d%H%M%S.json')
                 institution_number = school.inst_nr
                 
-                self._create_sys_event("SAPSYNC-001", f"Start importing Student data from Informat of Inst {institution_number}")
+                events.append(("SAPSYNC-001", f"Start importing Student data from Informat of Inst {institution_number}"))
                 
                 if dev_mode:
                     # Use local development files (students have their own subdirectory)
@@ -603,56 +953,52 @@ class InformatService(models.AbstractModel):
                         dev_mode=True,
                         is_student=True
                     )
-                    students_data = self._read_json_file(json_file_path)
+                    students_data = self._read_json_file(json_file_path, digests, institution_number)
                     
                     if students_data:
-                        for student in students_data:
-                            persoon_id = student.get('persoonId')
-                            if persoon_id:
-                                all_students[persoon_id] = json.dumps(student)
+                        all_students.update({
+                            student['persoonId']: student
+                            for student in students_data if student.get('persoonId')
+                        })
                     else:
-                        self._create_sys_event("SAPSYNC-900", f"File not found: {json_file_path}")
+                        events.append(("SAPSYNC-900", f"File not found: {json_file_path}"))
                 else:
-                    # Fetch from API
-                    json_file_path = self._get_file_path(
-                        f"students-{institution_number}-{file_suffix}",
-                        dev_mode=False
-                    )
+                    # Fetch from API (streamed to json_file_path by the worker)
+                    status_code, json_file_path = responses[school.id].result()
                     
-                    response = requests.get(
-                        f"{self.STUDENTS_API_URL}{student_id_string}?schoolYear={current_school_year}{timestamp_string}",
-                        headers={
-                            'Authorization': f'Bearer {bearer_token}',
-                            'InstituteNo': institution_number,
-                            'Accept': 'application/json'
-                        },
-                        timeout=60
-                    )
-                    
-                    if response.status_code != 200:
+                    if status_code != 200:
+                        if status_code == 401:
+                            self._invalidate_bearer_token()
+                        # Keep the buffered events ahead of the error in the log
+                        self._create_sys_events(events)
+                        events.clear()
                         self._create_sys_error("SAPSYNC-900", "Problem during retrieval of Student Data")
                         continue
                     
-                    response_data = response.json()
-                    students_data = response_data.get('students', [])
+                    students_data = None
+                    if json_file_path:
+                        students_data = self._load_json_file(
+                            json_file_path, digests, institution_number
+                        ).get('students', [])
                     
                     if students_data:
-                        # Write to file
-                        self._write_json_file(json_file_path, json.dumps(students_data))
-                        
-                        for student in students_data:
-                            persoon_id = student.get('persoonId')
-                            if persoon_id:
-                                all_students[persoon_id] = json.dumps(student)
+                        all_students.update({
+                            student['persoonId']: student
+                            for student in students_data if student.get('persoonId')
+                        })
             
-            self._create_sys_event("SAPSYNC-001", "Students retrieved successfully")
+            events.append(("SAPSYNC-001", "Students retrieved successfully"))
+            self._create_sys_events(events)
             return all_students
             
         except Exception as e:
+            self._create_sys_events(events)
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return None
 
-    def _get_employees_from_informat(self, timestamp: str, dev_mode: bool) -> Optional[Dict[str, str]]:
+    def _get_employees_from_informat(self, timestamp: str, dev_mode: bool,
+                                     digests: Optional[Dict[str, str]] = None,
+                                     schools=None) -> Optional[Dict[str, dict]]:
         """
         Retrieve Employee information from Informat.
         
@@ -660,10 +1006,14 @@ class InformatService(models.AbstractModel):
         
         @param timestamp: Retrieve changes after this timestamp
         @param dev_mode: Use local files if True
-        @return: Dict with personId&instNr as key and JSON string as value, or None on error
+        @param digests: Optional dict filled with a content digest of each school's payload
+        @param schools: Schools to import, defaults to all schools with Informat as SAP provider
+        @return: Dict with personId&instNr as key and parsed JSON dict as value, or None on error
         """
         procedure_name = '_get_employees_from_informat'
-        all_employees: Dict[str, str] = {}
+        all_employees: Dict[str, dict] = {}
+        # Per-school SysEvents, created in one batch when the retrieval ends
+        events: List[tuple] = []
 
 
         self._create_sys_event("SAPSYNC-001", "Start importing Employee information")
@@ -681,14 +1031,27 @@ class InformatService(models.AbstractModel):
                 if not bearer_token:
                     return None
             
-            # Get all schools with INFORMAT as SAP provider
-            Org = self.env['myschool.org']
-            schools = Org.search([('sap_provider', '=', '1')])  #todo: was INFORMAT - how to use string iso index
+            if schools is None:
+                schools = self._get_informat_schools()
+
+            responses = {}
+            if not dev_mode:
+                file_suffix = self._get_run_file_suffix()
+                responses = self._fetch_school_responses([
+                    (school.id,
+                     f"{self.EMPLOYEES_API_URL}?schoolyear={current_school_year}{timestamp_string}",
+                     {
+                         'Authorization': f'Bearer {bearer_token}',
+                         'Api-Version': '2',
+                         'InstituteNo': school.inst_nr,
+                     },
+                     self._get_file_path(f"employees-{school.inst_nr}-{file_suffix}", dev_mode=False))
+                    for school in schools
+                ])
             
             for school in schools:
-                self._create_sys_event("SAPSYNC-001", f"Start importing employee data for {school.inst_nr}")
+                events.append(("SAPSYNC-001", f"Start importing employee data for {school.inst_nr}"))
                 
-                file_suffix = datetime.now().strftime('%Y%m%d%H%M%S.json')
                 institution_number = school.inst_nr
                 
                 if dev_mode:
@@ -697,67 +1060,61 @@ class InformatService(models.AbstractModel):
                         f"dev-employees-{institution_number}.json",
                         dev_mode=True
                     )
-                    employees_data = self._read_json_file(json_file_path)
+                    employees_data = self._read_json_file(json_file_path, digests, institution_number)
                     
                     if employees_data:
-                        for employee in employees_data:
-                            person_id = employee.get('personId')
-                            if person_id:
-                                key = f"{person_id}&{institution_number}"
-                                all_employees[key] = json.dumps(employee)
+                        all_employees.update({
+                            f"{employee['personId']}&{institution_number}": employee
+                            for employee in employees_data if employee.get('personId')
+                        })
                     else:
-                        self._create_sys_event("SAPSYNC-900", f"File not found: {json_file_path}")
+                        events.append(("SAPSYNC-900", f"File not found: {json_file_path}"))
                 else:
-                    # Fetch from API
-                    json_file_path = self._get_file_path(
-                        f"employees-{institution_number}-{file_suffix}",
-                        dev_mode=False
-                    )
+                    # Fetch from API (streamed to json_file_path by the worker)
+                    status_code, json_file_path = responses[school.id].result()
                     
-                    response = requests.get(
-                        f"{self.EMPLOYEES_API_URL}?schoolyear={current_school_year}{timestamp_string}",
-                        headers={
-                            'Authorization': f'Bearer {bearer_token}',
-                            'Api-Version': '2',
-                            'InstituteNo': institution_number,
-                            'Accept': 'application/json'
-                        },
-                        timeout=60
-                    )
-                    
-                    if response.status_code != 200:
+                    if status_code != 200:
+                        if status_code == 401:
+                            self._invalidate_bearer_token()
+                        # Keep the buffered events ahead of the error in the log
+                        self._create_sys_events(events)
+                        events.clear()
                         self._create_sys_error("BETASK-900", f"{procedure_name}: Problem retrieving Employee Data")
                         continue
                     
-                    if response.text and response.text != '[]':
-                        # Write to file
-                        self._write_json_file(json_file_path, response.text)
-                        
-                        employees_data = response.json()
-                        for employee in employees_data:
-                            person_id = employee.get('personId')
-                            if person_id:
-                                key = f"{person_id}&{institution_number}"
-                                all_employees[key] = json.dumps(employee)
+                    if json_file_path:
+                        employees_data = self._load_json_file(json_file_path, digests, institution_number)
+                        all_employees.update({
+                            f"{employee['personId']}&{institution_number}": employee
+                            for employee in employees_data if employee.get('personId')
+                        })
             
-            self._create_sys_event("SAPSYNC-001", "Employees retrieved successfully")
+            events.append(("SAPSYNC-001", "Employees retrieved successfully"))
+            self._create_sys_events(events)
             return all_employees
             
         except Exception as e:
+            self._create_sys_events(events)
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return None
 
-    def _get_employee_assignments_from_informat(self, dev_mode: bool) -> Optional[Dict[str, str]]:
+    def _get_employee_assignments_from_informat(self, dev_mode: bool,
+                                                digests: Optional[Dict[str, str]] = None,
+                                                schools=None) -> Optional[Dict[str, dict]]:
         """
         Retrieve Employee Assignments information from Informat.
         
         Equivalent to Java: getEmployeeAssignmentsFromInformat()
         
         @param dev_mode: Use local files if True
-        @return: Dict with personId&instNr as key and JSON string as value, or None on error
+        @param digests: Optional dict filled with a content digest of each school's payload
+        @param schools: Schools to import, defaults to all schools with Informat as SAP provider
+        @return: Dict with personId&instNr as key and parsed JSON dict as value, or None on error
         """
         procedure_name = '_get_employee_assignments_from_informat'
-        all_assignments: Dict[str, str] = {}
+        all_assignments: Dict[str, dict] = {}
+        # Per-school SysEvents, created in one batch when the retrieval ends
+        events: List[tuple] = []
         
         self._create_sys_event("SAPSYNC-001", "Start importing Employee Assignment information")
         
@@ -772,14 +1129,27 @@ class InformatService(models.AbstractModel):
                 if not bearer_token:
                     return None
             
-            # Get all schools with INFORMAT as SAP provider
-            Org = self.env['myschool.org']
-            schools = Org.search([('sap_provider', '=', '1')])
+            if schools is None:
+                schools = self._get_informat_schools()
+
+            responses = {}
+            if not dev_mode:
+                file_suffix = self._get_run_file_suffix()
+                responses = self._fetch_school_responses([
+                    (school.id,
+                     f"{self.EMPLOYEE_ASSIGNMENTS_API_URL}?schoolyear={current_school_year}",
+                     {
+                         'Authorization': f'Bearer {bearer_token}',
+                         'Api-Version': '2',
+                         'InstituteNo': school.inst_nr,
+                     },
+                     self._get_file_path(f"employeeassignments-{school.inst_nr}-{file_suffix}", dev_mode=False))
+                    for school in schools
+                ])
             
             for school in schools:
-                self._create_sys_event("SAPSYNC-001", f"Start importing assignment data for {school.inst_nr}")
+                events.append(("SAPSYNC-001", f"Start importing assignment data for {school.inst_nr}"))
                 
-                file_suffix = datetime.now().strftime('%Y%m%d%H%M%S.json')
                 institution_number = school.inst_nr
                 
                 if dev_mode:
@@ -788,7 +1158,7 @@ class InformatService(models.AbstractModel):
                         f"dev-employeeassignments-{institution_number}.json",
                         dev_mode=True
                     )
-                    assignments_data = self._read_json_file(json_file_path)
+                    assignments_data = self._read_json_file(json_file_path, digests, institution_number)
                     
                     if assignments_data:
                         for assignment in assignments_data:
@@ -801,36 +1171,24 @@ class InformatService(models.AbstractModel):
                             if person_id:
                                 # Include assignmentId in key to handle multiple assignments per person
                                 key = f"{person_id}&{institution_number}&{assignment_id}"
-                                all_assignments[key] = json.dumps(assignment)
+                                all_assignments[key] = assignment
                     else:
-                        self._create_sys_event("SAPSYNC-900", f"File not found: {json_file_path}")
+                        events.append(("SAPSYNC-900", f"File not found: {json_file_path}"))
                 else:
-                    # Fetch from API
-                    json_file_path = self._get_file_path(
-                        f"employeeassignments-{institution_number}-{file_suffix}",
-                        dev_mode=False
-                    )
-                    
-                    response = requests.get(
-                        f"{self.EMPLOYEE_ASSIGNMENTS_API_URL}?schoolyear={current_school_year}",
-                        headers={
-                            'Authorization': f'Bearer {bearer_token}',
-                            'Api-Version': '2',
-                            'InstituteNo': institution_number,
-                            'Accept': 'application/json'
-                        },
-                        timeout=60
-                    )
+                    # Fetch from API (streamed to json_file_path by the worker)
+                    status_code, json_file_path = responses[school.id].result()
                     
-                    if response.status_code != 200:
+                    if status_code != 200:
+                        if status_code == 401:
+                            self._invalidate_bearer_token()
+                        # Keep the buffered events ahead of the error in the log
+                        self._create_sys_events(events)
+                        events.clear()
                         self._create_sys_error("BETASK-900", f"{procedure_name}: Problem retrieving Assignment Data")
                         continue
                     
-                    if response.text and response.text != '[]':
-                        # Write to file
-                        self._write_json_file(json_file_path, response.text)
-                        
-                        assignments_data = response.json()
+                    if json_file_path:
+                        assignments_data = self._load_json_file(json_file_path, digests, institution_number)
                         for assignment in assignments_data:
                             # Replace "id" with "assignmentId" to avoid conflicts
                             if 'id' in assignment:
@@ -841,12 +1199,14 @@ class InformatService(models.AbstractModel):
                             if person_id:
                                 # Include assignmentId in key to handle multiple assignments per person
                                 key = f"{person_id}&{institution_number}&{assignment_id}"
-                                all_assignments[key] = json.dumps(assignment)
+                                all_assignments[key] = assignment
             
-            self._create_sys_event("SAPSYNC-001", "Employee assignments retrieved successfully")
+            events.append(("SAPSYNC-001", "Employee assignments retrieved successfully"))
+            self._create_sys_events(events)
             return all_assignments
             
         except Exception as e:
+            self._create_sys_events(events)
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return None
 
@@ -870,8 +1230,10 @@ class InformatService(models.AbstractModel):
     # =============================================================================
     def _sync_employees(
             self,
-            all_imported_employee_data: Dict[str, str],
-            all_imported_employee_assignments: Dict[str, str]
+            all_imported_employee_data: Dict[str, dict],
+            all_imported_employee_assignments: Dict[str, dict],
+            analyze: bool = True,
+            processing_results: Optional[List[bool]] = None
     ) -> bool:
         """
         Main employee synchronization method - two phase approach.
@@ -880,7 +1242,13 @@ class InformatService(models.AbstractModel):
         Phase 1b: Sync Odoo Users for new/updated persons
         Phase 2: Sync PPSBR PropRelation objects for active employees
         Phase 2b: Sync Odoo Group memberships based on roles
+
+        @param analyze: False to only process the pending tasks (unchanged payload)
+        @param processing_results: Optional list receiving whether each task processing step succeeded
+        @return: False if an analysis phase failed
         """
+        if processing_results is None:
+            processing_results = []
         procedure_name = '_sync_employees'
         self._create_sys_event("BETASK-001", f"{procedure_name} started")
 
@@ -890,14 +1258,12 @@ class InformatService(models.AbstractModel):
             # =====================================================
             self._create_sys_event("BETASK-001", "Phase 1: Syncing Person objects")
 
-            if not self._sync_employee_persons(all_imported_employee_data, all_imported_employee_assignments):
+            if analyze and not self._sync_employee_persons(all_imported_employee_data, all_imported_employee_assignments):
                 self._create_sys_error("BETASK-900", f"{procedure_name}: Error in Phase 1 (Person sync)")
                 return False
 
             # Process DB-PERSON tasks (employees)
-            self._process_betasks('DB', 'PERSON', 'ADD')
-            self._process_betasks('DB', 'PERSON', 'UPD')
-            self._process_betasks('DB', 'PERSON', 'DEACT')
+            processing_results.append(self._process_betask_actions('DB', 'PERSON', ('ADD', 'UPD', 'DEACT')))
 
             # =====================================================
             # PHASE 1b: Sync Odoo Users (NEW!)
@@ -905,23 +1271,19 @@ class InformatService(models.AbstractModel):
             self._create_sys_event("BETASK-001", "Phase 1b: Syncing Odoo Users")
 
             # Process ODOO-PERSON tasks (creates res.users and hr.employee)
-            self._process_betasks('ODOO', 'PERSON', 'ADD')
-            self._process_betasks('ODOO', 'PERSON', 'UPD')
-            self._process_betasks('ODOO', 'PERSON', 'DEACT')
+            processing_results.append(self._process_betask_actions('ODOO', 'PERSON', ('ADD', 'UPD', 'DEACT')))
 
             # =====================================================
             # PHASE 2: Sync PPSBR PropRelation Objects
             # =====================================================
             self._create_sys_event("BETASK-001", "Phase 2: Syncing PPSBR PropRelation objects")
 
-            if not self._sync_employee_proprelations(all_imported_employee_assignments):
+            if analyze and not self._sync_employee_proprelations(all_imported_employee_assignments):
                 self._create_sys_error("BETASK-900", f"{procedure_name}: Error in Phase 2 (PPSBR sync)")
                 return False
 
             # Process DB-PROPRELATION tasks
-            self._process_betasks('DB', 'PROPRELATION', 'ADD')
-            self._process_betasks('DB', 'PROPRELATION', 'UPD')
-            self._process_betasks('DB', 'PROPRELATION', 'DEACT')
+            processing_results.append(self._process_betask_actions('DB', 'PROPRELATION', ('ADD', 'UPD', 'DEACT')))
 
             # =====================================================
             # PHASE 2b: Sync Odoo Group Memberships (NEW!)
@@ -929,8 +1291,7 @@ class InformatService(models.AbstractModel):
             self._create_sys_event("BETASK-001", "Phase 2b: Syncing Odoo Group memberships")
 
             # Process ODOO-GROUPMEMBER tasks (adds/removes users from groups)
-            self._process_betasks('ODOO', 'GROUPMEMBER', 'ADD')
-            self._process_betasks('ODOO', 'GROUPMEMBER', 'REMOVE')
+            processing_results.append(self._process_betask_actions('ODOO', 'GROUPMEMBER', ('ADD', 'REMOVE')))
 
             self._create_sys_event("BETASK-001", f"{procedure_name} completed successfully")
             return True
@@ -939,14 +1300,32 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return False
 
+    def _group_assignments_by_person_inst(
+            self,
+            all_imported_employee_assignments: Optional[Dict[str, dict]]
+    ) -> Dict[tuple, List[dict]]:
+        """
+        Group imported assignments by the person and institution in their key.
+
+        @param all_imported_employee_assignments: Dict with personId&instNr&assignmentId as key, assignment JSON as value
+        @return: Dict with (personId, instNr) as key and the list of assignment JSON as value
+        """
+        grouped = defaultdict(list)
+        for assign_key, assign_value in (all_imported_employee_assignments or {}).items():
+            # Key format: personId&instNr&assignmentId
+            assign_parts = assign_key.split('&')
+            if len(assign_parts) >= 2:
+                grouped[(assign_parts[0], assign_parts[1])].append(assign_value)
+        return grouped
+
     # =========================================================================
     # PHASE 1: Person Synchronization
     # =========================================================================
 
     def _sync_employee_persons(
             self,
-            all_imported_employee_data: Dict[str, str],
-            all_imported_employee_assignments: Dict[str, str] = None
+            all_imported_employee_data: Dict[str, dict],
+            all_imported_employee_assignments: Dict[str, dict] = None
     ) -> bool:
         """
         Phase 1: Synchronize Person objects based on imported employee data.
@@ -987,6 +1366,12 @@ class InformatService(models.AbstractModel):
             # Track persons added in this run (to handle multiple instNrs)
             added_persons = {}  # {person_uuid: first_inst_nr}
 
+            # Assignments grouped by (personId, instNr), built once instead of
+            # scanning all assignments for every employee
+            assignments_by_person_inst = self._group_assignments_by_person_inst(
+                all_imported_employee_assignments
+            )
+
             # =====================================================
             # Process each imported employee
             # =====================================================
@@ -1002,21 +1387,14 @@ class InformatService(models.AbstractModel):
                 inst_nr = key_parts[1]
 
                 # Parse employee JSON
-                employee_json = json.loads(employee_value)
+                employee_json = dict(employee_value)
                 employee_json['instNr'] = inst_nr
                 employee_json['person_type'] = 'EMPLOYEE'
 
                 # Include assignments for this person and instNr
-                if all_imported_employee_assignments:
-                    person_assignments = []
-                    for assign_key, assign_value in all_imported_employee_assignments.items():
-                        # Key format: personId&instNr&assignmentId
-                        assign_parts = assign_key.split('&')
-                        if len(assign_parts) >= 2:
-                            if assign_parts[0] == person_uuid and assign_parts[1] == inst_nr:
-                                person_assignments.append(json.loads(assign_value))
-                    if person_assignments:
-                        employee_json['assignments'] = person_assignments
+                person_assignments = assignments_by_person_inst.get((person_uuid, inst_nr))
+                if person_assignments:
+                    employee_json['assignments'] = person_assignments
 
                 # Get key fields
                 is_active_import = employee_json.get('isActive', True)
@@ -1042,7 +1420,7 @@ class InformatService(models.AbstractModel):
                             # CREATE: New person
                             self._create_betask(
                                 'DB', 'PERSON', 'ADD',
-                                json.dumps(employee_json),
+                                _json_dumps(employee_json),
                                 None
                             )
                             # EMPLOYEE PROPrelation type PPSBR will be added during the processing of the above created task
@@ -1055,8 +1433,8 @@ class InformatService(models.AbstractModel):
                             data2 = {'action': 'ADD-DETAILS', 'instNr': inst_nr}
                             self._create_betask(
                                 'DB', 'PERSON', 'UPD',
-                                json.dumps(employee_json),
-                                json.dumps(data2)
+                                _json_dumps(employee_json),
+                                _json_dumps(data2)
                             )
 
                     continue
@@ -1105,8 +1483,8 @@ class InformatService(models.AbstractModel):
                     data2 = {'action': 'REACTIVATE'}
                     self._create_betask(
                         'DB', 'PERSON', 'UPD',
-                        json.dumps(employee_json),
-                        json.dumps(data2)
+                        _json_dumps(employee_json),
+                        _json_dumps(data2)
                     )
                     self._create_sys_event("BETASK-001", f"REACTIVATE task created for: {person_uuid}")
                     continue
@@ -1118,8 +1496,8 @@ class InformatService(models.AbstractModel):
                     data2 = {'action': 'ADD-DETAILS', 'instNr': inst_nr}
                     self._create_betask(
                         'DB', 'PERSON', 'UPD',
-                        json.dumps(employee_json),
-                        json.dumps(data2)
+                        _json_dumps(employee_json),
+                        _json_dumps(data2)
                     )
                     self._create_sys_event("BETASK-001",
                                            f"ADD-DETAILS task created for: {person_uuid}, instNr: {inst_nr}")
@@ -1128,31 +1506,18 @@ class InformatService(models.AbstractModel):
                 # -----------------------------------------------------
                 # SCENARIO 2d: Compare and UPDATE if changed
                 # -----------------------------------------------------
+                # The stored hash leaves out instNr and person_type (metadata, not
+                # employee data); it is False when the stored JSON can't be parsed,
+                # in which case we update anyway
                 if person_details and person_details.full_json_string:
-                    try:
-                        current_json = json.loads(person_details.full_json_string)
-                        # Remove instNr from comparison (it's metadata, not employee data)
-                        compare_current = {k: v for k, v in current_json.items()
-                                           if k not in ['instNr', 'person_type']}
-                        compare_new = {k: v for k, v in employee_json.items()
-                                       if k not in ['instNr', 'person_type']}
-
-                        if compare_current != compare_new:
-                            data2 = {'action': 'UPDATE'}
-                            self._create_betask(
-                                'DB', 'PERSON', 'UPD',
-                                json.dumps(employee_json),
-                                json.dumps(data2)
-                            )
-                            self._create_sys_event("BETASK-001", f"UPDATE task created for: {person_uuid}")
-                    except json.JSONDecodeError:
-                        # If we can't parse, update anyway
+                    if person_details.full_json_hash != PersonDetails._json_content_hash(employee_json):
                         data2 = {'action': 'UPDATE'}
                         self._create_betask(
                             'DB', 'PERSON', 'UPD',
-                            json.dumps(employee_json),
-                            json.dumps(data2)
+                            _json_dumps(employee_json),
+                            _json_dumps(data2)
                         )
+                        self._create_sys_event("BETASK-001", f"UPDATE task created for: {person_uuid}")
 
             # =====================================================
             # Check for persons to DEACTIVATE (in DB but not in import)
@@ -1174,7 +1539,7 @@ class InformatService(models.AbstractModel):
                     deact_data['person_type'] = 'EMPLOYEE'
                     self._create_betask(
                         'DB', 'PERSON', 'DEACT',
-                        json.dumps(deact_data),
+                        _json_dumps(deact_data),
                         None
                     )
                     self._create_sys_event("BETASK-001",
@@ -1296,7 +1661,7 @@ class InformatService(models.AbstractModel):
                 deact_fallback = {'personId': person.sap_person_uuid, 'person_type': 'EMPLOYEE'}
                 self._create_betask(
                     'DB', 'PERSON', 'DEACT',
-                    json.dumps(employee_json) if employee_json else json.dumps(deact_fallback),
+                    _json_dumps(employee_json) if employee_json else _json_dumps(deact_fallback),
                     None
                 )
                 self._create_sys_event("BETASK-001",
@@ -1313,7 +1678,7 @@ class InformatService(models.AbstractModel):
             }
             self._create_betask(
                 'DB', 'PROPRELATION', 'DEACT',
-                json.dumps(deact_data),
+                _json_dumps(deact_data),
                 None
             )
             self._create_sys_event("BETASK-001",
@@ -1323,7 +1688,7 @@ class InformatService(models.AbstractModel):
     # PHASE 2: PropRelation Synchronization (UPDATED)
     # =========================================================================
 
-    def _sync_employee_proprelations(self, all_imported_employee_assignments: Dict[str, str]) -> bool:
+    def _sync_employee_proprelations(self, all_imported_employee_assignments: Dict[str, dict]) -> bool:
         """
         Phase 2: Synchronize PropRelation objects (PPSBR) for active employees.
 
@@ -1406,7 +1771,7 @@ class InformatService(models.AbstractModel):
                     person_uuid = key_parts[0]
                     inst_nr = key_parts[1]
 
-                    assignment_json = json.loads(assignment_value)
+                    assignment_json = dict(assignment_value)
                     assignment_json['instNr'] = inst_nr
 
                     if person_uuid not in assignments_by_person:
@@ -1499,7 +1864,7 @@ class InformatService(models.AbstractModel):
                         # (the corresponding PPSBR will be deactivated)
                         assignment_end_date = self._parse_date_safe(assignment.get('einddatum'))
                         if assignment_end_date and assignment_end_date < one_week_ago:
-                            _logger.info(f"Assignment for {person.name} has end date {assignment_end_date} (> 1 week ago) - skipping")
+                            _logger.info("Assignment for %s has end date %s (> 1 week ago) - skipping", person.name, assignment_end_date)
                             continue
 
                         # Find the SAP Role TODO: REQUIRED?????
@@ -1582,7 +1947,7 @@ class InformatService(models.AbstractModel):
                             }
                             self._create_betask(
                                 'DB', 'PROPRELATION', 'ADD',
-                                json.dumps(proprel_data),
+                                _json_dumps(proprel_data),
                                 None
                             )
                             self._create_sys_event("BETASK-001",
@@ -1601,19 +1966,19 @@ class InformatService(models.AbstractModel):
                 if existing_ppsbr:
                     self._create_sys_event("BETASK-DEBUG",
                         f"Person {person.name}: {len(existing_ppsbr)} existing PPSBRs, {len(processed_ppsbr_keys)} processed keys")
-                    _logger.info(f"Person {person.name}: processed_ppsbr_keys = {processed_ppsbr_keys}")
+                    _logger.info("Person %s: processed_ppsbr_keys = %s", person.name, processed_ppsbr_keys)
 
                 for ppsbr in existing_ppsbr:
                     # Skip EMPLOYEE role PPSBRs - they are managed separately
                     ppsbr_role_id = ppsbr.id_role.id if ppsbr.id_role else None
                     if ppsbr_role_id and ppsbr_role_id == employee_role_id:
-                        _logger.debug(f"Skipping EMPLOYEE PPSBR {ppsbr.id} for {person.name} - managed by person lifecycle, not assignments")
+                        _logger.debug("Skipping EMPLOYEE PPSBR %s for %s - managed by person lifecycle, not assignments", ppsbr.id, person.name)
                         continue
 
                     # Build key from existing record (without period for employees)
                     existing_key = f"{ppsbr.id_person.id}_{ppsbr.id_org.id if ppsbr.id_org else ''}_{ppsbr_role_id or ''}"
 
-                    _logger.info(f"PPSBR {ppsbr.id} key: {existing_key}, in processed: {existing_key in processed_ppsbr_keys}")
+                    _logger.info("PPSBR %s key: %s, in processed: %s", ppsbr.id, existing_key, existing_key in processed_ppsbr_keys)
 
                     if existing_key not in processed_ppsbr_keys:
                         # Check if this PPSBR has a SAP role that should have been a Backend role
@@ -1639,7 +2004,7 @@ class InformatService(models.AbstractModel):
                         }
                         self._create_betask(
                             'DB', 'PROPRELATION', 'DEACT',
-                            json.dumps(deact_data),
+                            _json_dumps(deact_data),
                             None
                         )
                         self._create_sys_event("BETASK-001",
@@ -1681,7 +2046,7 @@ class InformatService(models.AbstractModel):
             except (ValueError, TypeError):
                 continue
 
-        _logger.warning(f"Could not parse date: {date_string}")
+        _logger.warning("Could not parse date: %s", date_string)
         return None
 
 # =============================================================================
@@ -1731,7 +2096,7 @@ class InformatService(models.AbstractModel):
 # =============================================================================
 
 
-    def _analyze_student_data_and_create_org_tasks(self, all_registrations: Dict[str, str]) -> bool:
+    def _analyze_student_data_and_create_org_tasks(self, all_registrations: Dict[str, dict]) -> bool:
         """
         Analyze imported registration data and create Org (class group) tasks.
         
@@ -1810,8 +2175,7 @@ class InformatService(models.AbstractModel):
                 school_shortname_cache[inst_nr_val] = ci_lookup_org.name_short
                 return ci_lookup_org.name_short
 
-            for persoon_id, registration_json in all_registrations.items():
-                registration = json.loads(registration_json)
+            for persoon_id, registration in all_registrations.items():
 
                 self._create_sys_event("SAPSYNC-001", f"Processing registration for {persoon_id}")
 
@@ -1865,7 +2229,7 @@ class InformatService(models.AbstractModel):
                             'period': current_period.id,
                             'schoolyear': schoolyear_name
                         }
-                        self._create_betask('DB', 'ORG', task_action, json.dumps(task_data), '')
+                        self._create_betask('DB', 'ORG', task_action, _json_dumps(task_data), '')
 
             # Check for classes to deactivate
             all_active_classes = Org.search([
@@ -1885,7 +2249,7 @@ class InformatService(models.AbstractModel):
                         'period': current_period.id,
                         'schoolyear': schoolyear_name
                     }
-                    self._create_betask('DB', 'ORG', 'DEACT', json.dumps(task_data), '')
+                    self._create_betask('DB', 'ORG', 'DEACT', _json_dumps(task_data), '')
             
             return True
             
@@ -1893,8 +2257,8 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return False
 
-    def _analyze_data_and_create_student_tasks(self, all_registrations: Dict[str, str], 
-                                                all_students: Dict[str, str]) -> bool:
+    def _analyze_data_and_create_student_tasks(self, all_registrations: Dict[str, dict], 
+                                                all_students: Dict[str, dict]) -> bool:
         """
         Analyze imported data and create Student tasks.
         
@@ -1914,13 +2278,12 @@ class InformatService(models.AbstractModel):
             Person = self.env['myschool.person']
             processed_students: List[str] = []
             
-            for persoon_id, registration_json in all_registrations.items():
-                registration = json.loads(registration_json)
+            for persoon_id, registration in all_registrations.items():
                 
                 # Get student details if available
                 student_details = {}
                 if persoon_id in all_students:
-                    student_details = json.loads(all_students[persoon_id])
+                    student_details = all_students[persoon_id]
                 
                 # Check if person exists in database
                 existing_persons = Person.search([('sap_person_uuid', '=', persoon_id)])
@@ -1930,7 +2293,7 @@ class InformatService(models.AbstractModel):
                     action = 'ADD'
                     person_data = self._merge_registration_and_student_data(registration, student_details)
                     person_data['person_type'] = 'STUDENT'
-                    self._create_betask('DB', 'PERSON', 'ADD', json.dumps(person_data), '')
+                    self._create_betask('DB', 'PERSON', 'ADD', _json_dumps(person_data), '')
 
                 elif len(existing_persons) == 1:
                     # Check for updates
@@ -1944,7 +2307,7 @@ class InformatService(models.AbstractModel):
                             'regEndDate': reg_end_date,
                             'person_type': 'STUDENT'
                         }
-                        self._create_betask('DB', 'PERSON', 'DEACT', json.dumps(task_data), '')
+                        self._create_betask('DB', 'PERSON', 'DEACT', _json_dumps(task_data), '')
                         continue
 
                     # Check for reactivation
@@ -1957,7 +2320,7 @@ class InformatService(models.AbstractModel):
                             'regStartDate': registration.get('regStartDate'),
                             'person_type': 'STUDENT'
                         }
-                        self._create_betask('DB', 'PERSON', 'UPD', json.dumps(task_data), '')
+                        self._create_betask('DB', 'PERSON', 'UPD', _json_dumps(task_data), '')
                         continue
 
                     # Check for field updates
@@ -1970,7 +2333,7 @@ class InformatService(models.AbstractModel):
                         diff_new['persoonId'] = person_in_db.sap_person_uuid
                         diff_new['person_type'] = 'STUDENT'
                         diff_original['persoonId'] = person_in_db.sap_person_uuid
-                        self._create_betask('DB', 'PERSON', 'UPD', json.dumps(diff_new), json.dumps(diff_original))
+                        self._create_betask('DB', 'PERSON', 'UPD', _json_dumps(diff_new), _json_dumps(diff_original))
                 
                 processed_students.append(persoon_id)
             
@@ -1980,7 +2343,7 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return False
 
-    def _analyze_data_and_create_relation_tasks(self, all_students: Dict[str, str]) -> bool:
+    def _analyze_data_and_create_relation_tasks(self, all_students: Dict[str, dict]) -> bool:
         """
         Analyze imported student data and create Relation tasks.
         
@@ -2000,28 +2363,26 @@ class InformatService(models.AbstractModel):
             
             Person = self.env['myschool.person']
             
-            for persoon_id, student_json in all_students.items():
-                student = json.loads(student_json)
+            for persoon_id, student in all_students.items():
                 
                 # Process relations
                 relations = student.get('relaties', [])
-                relations_map: Dict[str, str] = {}
+                relations_map: Dict[str, dict] = {}
                 
                 for relation in relations:
                     relatie_id = relation.get('relatieId')
                     if relatie_id and relatie_id not in relations_map:
-                        relations_map[relatie_id] = json.dumps(relation)
+                        relations_map[relatie_id] = relation
                 
                 # Analyze and create tasks for each relation
-                for relatie_id, relation_json in relations_map.items():
+                for relatie_id, relation_data in relations_map.items():
                     existing_persons = Person.search([('sap_person_uuid', '=', relatie_id)])
                     
                     if not existing_persons:
                         # Create ADD task for new relation
-                        self._create_betask('DB', 'RELATION', 'ADD', relation_json, 'RELATION')
+                        self._create_betask('DB', 'RELATION', 'ADD', _json_dumps(relation_data), 'RELATION')
                     else:
                         # Check for updates
-                        relation_data = json.loads(relation_json)
                         person_in_db = existing_persons[0]
                         
                         diff_new, diff_original = self._compare_relation_fields(person_in_db, relation_data)
@@ -2029,7 +2390,7 @@ class InformatService(models.AbstractModel):
                         if diff_new:
                             diff_new['persoonId'] = person_in_db.sap_person_uuid
                             diff_original['persoonId'] = person_in_db.sap_person_uuid
-                            self._create_betask('DB', 'RELATION', 'UPD', json.dumps(diff_new), json.dumps(diff_original))
+                            self._create_betask('DB', 'RELATION', 'UPD', _json_dumps(diff_new), _json_dumps(diff_original))
             
             return True
             
@@ -2037,7 +2398,7 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return False
 
-    def _analyze_employee_assignments_and_create_roles(self, all_assignments: Dict[str, str]) -> bool:
+    def _analyze_employee_assignments_and_create_roles(self, all_assignments: Dict[str, dict]) -> bool:
         """
         Analyze employee assignments and create new roles if needed.
         
@@ -2060,8 +2421,7 @@ class InformatService(models.AbstractModel):
             processed_assignments: List[str] = []
             first_task = True
             
-            for assignment_key, assignment_json in all_assignments.items():
-                assignment = json.loads(assignment_json)
+            for assignment_key, assignment in all_assignments.items():
                 
                 self._create_sys_event("BETASK-001", f"Processing assignment: {assignment_key}")
                 
@@ -2098,7 +2458,7 @@ class InformatService(models.AbstractModel):
                         #     BeTask.create_task('ALL', 'ROLE', 'MANUAL', message, '')
                         #     first_task = False
                         #
-                        self._create_betask('DB', 'ROLE', 'ADD', json.dumps(task_data), '')
+                        self._create_betask('DB', 'ROLE', 'ADD', _json_dumps(task_data), '')
                         self._create_sys_event("BETASK-001", f"a New SapRole is create. Link manual to a BackendRole and link this BR to one or moge Orgs: {assignment_key}")
 
                     # elif len(existing_roles) > 1:
@@ -2114,7 +2474,7 @@ class InformatService(models.AbstractModel):
             self._create_sys_error("BETASK-900", f"{procedure_name}: {traceback.format_exc()}")
             return False
 
-    def _analyze_employee_assignments_and_create_role_org_relations(self, all_assignments: Dict[str, str]) -> bool:
+    def _analyze_employee_assignments_and_create_role_org_relations(self, all_assignments: Dict[str, dict]) -> bool:
         """
         Analyze employee assignments and create role-org relations.
         
@@ -2137,8 +2497,7 @@ class InformatService(models.AbstractModel):
             processed_assignments: List[str] = []
             first_task = True
             
-            for assignment_key, assignment_json in all_assignments.items():
-                assignment = json.loads(assignment_json)
+            for assignment_key, assignment in all_assignments.items():
                 
                 self._create_sys_event("BETASK-001", f"Processing assignment: {assignment_key}")
                 
@@ -2191,7 +2550,7 @@ class InformatService(models.AbstractModel):
                                 self._create_betask('ALL', 'ROLE', 'MANUAL', message, '')
                                 first_task = False
                             
-                            self._create_betask('ALL', 'ROLE', 'UPD', json.dumps(task_data), '')
+                            self._create_betask('ALL', 'ROLE', 'UPD', _json_dumps(task_data), '')
                         
                         elif len(role_relations) > 1:
                             self._create_sys_error("ROLE-ADD", 
@@ -2215,7 +2574,7 @@ class InformatService(models.AbstractModel):
         BeTaskType = self.env.get(self.BETASK_TYPE_MODEL)
         
         if not self.BETASK_MODEL or self.BETASK_TYPE_MODEL in self.env:
-            _logger.warning(f"BeTask model '{self.BETASK_MODEL}' or BeTaskType model '{self.BETASK_TYPE_MODEL}' not found")
+            _logger.warning("BeTask model '%s' or BeTaskType model '%s' not found", self.BETASK_MODEL, self.BETASK_TYPE_MODEL)
             return False
 
         blocking_task_type = BeTaskType.search([
@@ -2262,14 +2621,30 @@ class InformatService(models.AbstractModel):
         return False
 
     ## LOOT VIA TASKPROCESSOR
-    def _process_betasks(self, target: str, obj: str, action: str) -> None:
+    def _process_betask_actions(self, target: str, obj: str, actions: tuple) -> bool:
+        """
+        Process the BeTasks of several actions on the same target and object, in order.
+        
+        @param target: Task target (DB, LDAP, ALL)
+        @param obj: Task object (STUDENT, EMPLOYEE, ORG, ROLE, etc.)
+        @param actions: Task actions (ADD, UPD, DEACT, etc.)
+        @return: True if the tasks of every action were processed without errors
+        """
+        results = [self._process_betasks(target, obj, action) for action in actions]
+        return all(results)
+
+    def _process_betasks(self, target: str, obj: str, action: str) -> bool:
         """
         Process BeTasks of a specific type.
         
         @param target: Task target (DB, LDAP, ALL)
         @param obj: Task object (STUDENT, EMPLOYEE, ORG, ROLE, etc.)
         @param action: Task action (ADD, UPD, DEACT, etc.)
+        @return: False if a task of this type failed
         """
+        # Tasks still waiting in the batch must exist before they can be processed
+        batching = self._flush_betasks()
+
         BeTaskProcessor = self.env.get('myschool.betask.processor')
         BeTaskType = self.env.get(self.BETASK_TYPE_MODEL)
 
@@ -2279,21 +2654,72 @@ class InformatService(models.AbstractModel):
             (self.BETASKTYPE_ACTION_FIELD, '=', action)
         ], limit=1)
 
+        processed = True
         if task_type.exists():
-            BeTaskProcessor.process_tasks_by_type(task_type)
+            processed = bool(BeTaskProcessor.process_tasks_by_type(task_type))
         elif task_type:
-            _logger.info(f"Task type found for {target}-{obj}-{action}, but no processor available")
+            _logger.info("Task type found for %s-%s-%s, but no processor available", target, obj, action)
+
+        if batching:
+            # The processor commits per task; keep collecting afterwards
+            self._start_betask_batch()
+        return processed
+
+    def _start_betask_batch(self) -> None:
+        """Collect the vals of BeTasks created from now on instead of creating them one by one."""
+        self.env.cr.cache.setdefault(self._BETASK_BATCH_CACHE_KEY, [])
+
+    def _flush_betasks(self) -> bool:
+        """
+        Create the collected BeTasks with a single create.
+
+        If the batch create fails, each task is retried separately so that one
+        bad task does not lose the others.
+
+        @return: True if a batch is active
+        """
+        batch = self.env.cr.cache.get(self._BETASK_BATCH_CACHE_KEY)
+        if batch is None:
+            return False
+        if not batch:
+            return True
+
+        vals_list = list(batch)
+        batch.clear()
+        BeTask = self.env[self.BETASK_MODEL].with_context(
+            tracking_disable=True, mail_create_nolog=True, mail_notrack=True
+        )
+        try:
+            with self.env.cr.savepoint():
+                BeTask.create(vals_list)
+        except Exception as e:
+            _logger.error("Error creating %s BeTasks in batch, retrying one by one: %s", len(vals_list), e)
+            for vals in vals_list:
+                try:
+                    with self.env.cr.savepoint():
+                        BeTask.create(vals)
+                except Exception as e:
+                    _logger.error("Error creating BeTask: %s", e)
+        return True
+
+    def _end_betask_batch(self) -> None:
+        """Create the collected BeTasks and stop collecting."""
+        self._flush_betasks()
+        self.env.cr.cache.pop(self._BETASK_BATCH_CACHE_KEY, None)
 
     def _create_betask(self, target: str, obj: str, action: str, data: str, data2: str) -> Any:
         """
         Create a BeTask record.
+
+        While a BeTask batch is active (see _start_betask_batch) the vals are
+        only collected and the task is created by the next _flush_betasks.
         
         @param target: Task target
         @param obj: Task object
         @param action: Task action
         @param data: JSON data for the task
         @param data2: Additional JSON data
-        @return: Created BeTask record
+        @return: Created BeTask record, None when collected in a batch
         """
         # BeTaskService = self.env.get('myschool.betask.service')
         # if BeTaskService and hasattr(BeTaskService, 'create_betask'):
@@ -2316,7 +2742,7 @@ class InformatService(models.AbstractModel):
         if task_type:
             try:
 
-                json_data = json.loads(data)
+                json_data = _json_loads(data)
 
                 # Default taskname
                 taskname = f"{action} {obj}"
@@ -2347,19 +2773,24 @@ class InformatService(models.AbstractModel):
                     vals[self.BETASK_DATA_FIELD] = data
                 if data2 and self.BETASK_DATA2_FIELD in BeTask._fields:
                     vals[self.BETASK_DATA2_FIELD] = data2
+
+                batch = self.env.cr.cache.get(self._BETASK_BATCH_CACHE_KEY)
+                if batch is not None:
+                    batch.append(vals)
+                    return None
                     
                 return BeTask.create(vals)
             except Exception as e:
-                _logger.error(f"Error creating BeTask: {e}")
+                _logger.error("Error creating BeTask: %s", e)
                 return None
         else:
-            _logger.warning(f"BeTaskType not found for: {target}-{obj}-{action}")
+            _logger.warning("BeTaskType not found for: %s-%s-%s", target, obj, action)
         
         return None
 
     def _create_sys_event(self, code: str, message: str) -> None:
         """Create a system event log entry."""
-        _logger.info(f"{code}: {message}")
+        _logger.info("%s: %s", code, message)
 
         if 'myschool.sys.event.service' in self.env:
             self.env['myschool.sys.event.service'].create_sys_event(code, message, True)
@@ -2368,47 +2799,83 @@ class InformatService(models.AbstractModel):
         # if SysEvent:
         #     SysEvent.create_sys_event(code, message, True)
 
+    def _create_sys_events(self, events: List[tuple]) -> None:
+        """Create system event log entries for a list of (code, message) tuples in one batch."""
+        if not events:
+            return
+        for code, message in events:
+            _logger.info("%s: %s", code, message)
+
+        if 'myschool.sys.event.service' in self.env:
+            self.env['myschool.sys.event.service'].create_sys_events(events, True)
+
     def _create_sys_error(self, code: str, message: str, error_type: str = 'ERROR-BLOCKING') -> None:
         """Create a system error log entry."""
-        _logger.error(f"{code}: {message}")
+        _logger.error("%s: %s", code, message)
         
         SysEvent = self.env.get('myschool.sys.event.service')
         if SysEvent:
             SysEvent.create_sys_error(code, message, error_type, True)
 
-    def _read_json_file(self, file_path: str) -> Optional[List[Dict]]:
+    def _load_json_file(self, file_path: str, digests: Optional[Dict[str, str]] = None,
+                        digest_key: str = None) -> Any:
+        """
+        Read and parse a JSON file, raising on errors.
+        
+        @param file_path: Path to the JSON file
+        @param digests: Optional dict receiving the digest of the raw file bytes
+        @param digest_key: Key under which the digest is stored in digests
+        @return: Parsed JSON data
+        """
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        if digests is not None:
+            digests[digest_key] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return _json_loads(raw)
+
+    def _read_json_file(self, file_path: str, digests: Optional[Dict[str, str]] = None,
+                        digest_key: str = None) -> Optional[List[Dict]]:
         """
         Read and parse a JSON file.
         
         @param file_path: Path to the JSON file
+        @param digests: Optional dict receiving the digest of the raw file bytes
+        @param digest_key: Key under which the digest is stored in digests
         @return: Parsed JSON data or None if file doesn't exist
         """
         try:
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_json_file(file_path, digests, digest_key)
             return None
         except Exception as e:
-            _logger.error(f"Error reading JSON file {file_path}: {e}")
+            _logger.error("Error reading JSON file %s: %s", file_path, e)
             return None
 
-    def _write_json_file(self, file_path: str, content: str) -> bool:
+    def _write_json_file(self, file_path: str, content) -> bool:
         """
         Write content to a JSON file.
+
+        Bytes (e.g. a response body) are written as-is, without a decode and
+        re-encode. The file is written next to its target and moved into
+        place, so readers never see a partial file.
         
         @param file_path: Path to the JSON file
-        @param content: Content to write
+        @param content: Content to write, bytes or str
         @return: True if successful
         """
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
+
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            tmp_path = f"{file_path}.part"
+            with open(tmp_path, 'wb') as f:
                 f.write(content)
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
-            _logger.error(f"Error writing JSON file {file_path}: {e}")
+            _logger.error("Error writing JSON file %s: %s", file_path, e)
             return False
 
     def _merge_registration_and_student_data(self, registration: Dict, student: Dict) -> Dict:
@@ -110,6 +110,13 @@ class InformatServiceConfig(models.Model):
         help='Sync student data and relations from Informat'
     )
 
+    skip_unchanged_payloads = fields.Boolean(
+        string='Skip Unchanged Payloads',
+        default=False,
+        help='Skip the analysis of a sync phase when the data retrieved from '
+             'Informat is identical to the data of its last completed run'
+    )
+
     sync_days_back = fields.Integer(
         string='Sync Days Back',
         default=15,
@@ -170,6 +177,23 @@ class InformatServiceConfig(models.Model):
         readonly=True
     )
     
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._clear_storage_path_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self._clear_storage_path_cache()
+        return super().write(vals)
+
+    def unlink(self):
+        self._clear_storage_path_cache()
+        return super().unlink()
+
+    def _clear_storage_path_cache(self):
+        """Drop the storage paths the Informat service resolved in this transaction."""
+        self.env.cr.cache.pop(self.env['myschool.informat.service']._STORAGE_PATH_CACHE_KEY, None)
+
     @api.model
     def get_config(self):
         """
@@ -18,7 +18,7 @@ class Org(models.Model):
     SAP_PROVIDER_SELECTION = [('1', 'INFORMAT'), ('2', 'NONE')]  #TODO : get providers from database in stead of selection
 
     name = fields.Char(string='Naam', required=True)
-    name_short = fields.Char(string='Korte Naam', required=True)
+    name_short = fields.Char(string='Korte Naam', required=True, index=True)
     name_tree = fields.Char(string='Full Tree name', required=False)
     inst_nr = fields.Char(string='Instellingsnummer', required=True, size=10)
     is_active = fields.Boolean(string='Actief', default=True, required=True)
@@ -62,6 +62,9 @@ class Org(models.Model):
     orggroup_working_period = fields.Char(string='Werktijd Periode', size=30)
     richting = fields.Char(string='Richting', size=30)
 
+    # Serves the Informat sync lookup of the schools it imports (sap_provider = INFORMAT)
+    _sap_provider_informat_idx = models.Index("(sap_provider) WHERE sap_provider = '1'")
+
     # =========================================================================
     # Audit Trail - Create backend tasks for manual changes
     # =========================================================================
@@ -77,6 +80,9 @@ class Org(models.Model):
     def create(self, vals_list):
         """Override create to log audit trail."""
         records = super().create(vals_list)
+        # Config item lookups cache unknown org short names as well
+        if any(vals.get('name_short') for vals in vals_list):
+            self.env['myschool.config.item']._clear_ci_value_caches()
 
         for record in records:
             record._create_audit_task('ADD', new_values=record._get_audit_values())
@@ -108,6 +114,10 @@ class Org(models.Model):
 
         result = super().write(vals)
 
+        # Config item lookups are keyed on the org short name
+        if 'name_short' in vals:
+            self.env['myschool.config.item']._clear_ci_value_caches()
+
         # Create audit tasks after write
         for record in self:
             old_values = old_values_map.get(record.id, {})
@@ -148,6 +158,7 @@ class Org(models.Model):
         for record in self:
             record._create_audit_task('DEL', old_values=record._get_audit_values())
 
+        self.env['myschool.config.item']._clear_ci_value_caches()
         return super().unlink()
 
     def _get_audit_values(self):
@@ -1,4 +1,5 @@
 # models/person_details.py
+import hashlib
 import json
 import logging
 
@@ -36,6 +37,15 @@ class PersonDetails(models.Model):
     extra_field_1 = fields.Char(string='Extra Veld 1 / InstNr')  # Mapped from extraField1 in Java
     is_active = fields.Boolean(string='Is Actief', default=False)
 
+    # Digest of full_json_string, lets the Informat sync detect changed employees
+    # without parsing and comparing every stored JSON string
+    full_json_hash = fields.Char(
+        string='JSON Content Hash',
+        compute='_compute_full_json_hash',
+        store=True,
+        readonly=True
+    )
+
     # Computed Html fields for formatted display
     full_json_string_html = fields.Html(string='JSON Data', compute='_compute_json_html', sanitize=False)
     addresses_html = fields.Html(string='Adressen', compute='_compute_json_html', sanitize=False)
@@ -60,6 +70,36 @@ class PersonDetails(models.Model):
                 html_value = f'<pre style="background-color: #f5f5f5; padding: 10px; border-radius: 4px; overflow-x: auto; font-family: monospace; font-size: 12px;">{escaped}</pre>' if value else ''
                 setattr(record, f'{field_name}_html', html_value)
 
+    # Sync metadata keys that are not part of the person data, left out of the content hash
+    _HASH_EXCLUDED_KEYS = ('instNr', 'person_type')
+
+    @api.depends('full_json_string')
+    def _compute_full_json_hash(self):
+        """Hash the person data in full_json_string; False when it is not a JSON object."""
+        for record in self:
+            data = None
+            if record.full_json_string:
+                try:
+                    data = json.loads(record.full_json_string)
+                    # Check if result is still a string (double-encoded JSON)
+                    if isinstance(data, str):
+                        data = json.loads(data)
+                except (json.JSONDecodeError, TypeError):
+                    data = None
+            record.full_json_hash = self._json_content_hash(data) if isinstance(data, dict) else False
+
+    @api.model
+    def _json_content_hash(self, data):
+        """
+        Compute the content hash of person JSON data, independent of key order and formatting.
+
+        @param data: Parsed person JSON (dict)
+        @return: Hex digest
+        """
+        content = {k: v for k, v in data.items() if k not in self._HASH_EXCLUDED_KEYS}
+        canonical = json.dumps(content, sort_keys=True, separators=(',', ':'))
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
     # JSON fields that should be pretty-printed
     _JSON_FIELDS = [
         'full_json_string', 'addresses', 'emails', 'comnrs',
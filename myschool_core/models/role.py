@@ -195,8 +195,20 @@ class Role(models.Model):
     # CRUD Overrides
     # =========================================================================
 
+    # Fields that determine which Odoo groups are managed via roles
+    _ODOO_GROUP_FIELDS = ('has_odoo_group', 'odoo_group_id')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if any(vals.get('has_odoo_group') for vals in vals_list):
+            self.env.registry.clear_cache()
+        return records
+
     def write(self, vals):
         result = super().write(vals)
+        if any(field in vals for field in self._ODOO_GROUP_FIELDS):
+            self.env.registry.clear_cache()
         if vals.get('has_group'):
             processor = self.env['myschool.betask.processor']
             for role in self:
@@ -206,6 +218,13 @@ class Role(models.Model):
                     _logger.warning(f'[PG-SYNC] Failed to sync persongroups for role {role.name}: {e}')
         return result
 
+    def unlink(self):
+        clear_cache = any(self.mapped('has_odoo_group'))
+        result = super().unlink()
+        if clear_cache:
+            self.env.registry.clear_cache()
+        return result
+
     # =========================================================================
     # Service Methods (from RoleServiceImpl.java)
     # =========================================================================
@@ -672,11 +691,11 @@ class Role(models.Model):
         role_org_map = self.find_employee_roles_by_person(person_id)
         
         result = []
-        Org = self.env.get('myschool.org')
+        Org = self.env['myschool.org']
         
         for role_id, org_id in role_org_map.items():
             role = self.browse(role_id)
-            org = Org.browse(org_id) if Org else None
+            org = Org.browse(org_id)
             
             result.append({
                 'role_id': role_id,
@@ -242,6 +242,54 @@ class SysEventService(models.AbstractModel):
                 )
             return self.env['myschool.sys.event']  # Return empty recordset
     
+    @api.model
+    def create_sys_events(self, events, log_to_screen=False, source='BE'):
+        """
+        Creates several events in the SysEvent table with a single create
+        Batch variant of create_sys_event for callers that log many events in a row.
+        
+        :param events: List of (code, data) tuples
+        :param log_to_screen: If True, log events to console/screen (pLogtoscreen)
+        :param source: Source system (default: 'BE' for Backend)
+        :return: Created event records
+        """
+        if not events:
+            return self.env['myschool.sys.event']
+        try:
+            type_service = self.env['myschool.sys.event.type.service']
+            event_type = type_service.get_or_create(
+                name='EVENT',
+                code='EVENT',
+                priority=3,
+                description='General system event'
+            )
+            
+            created = self.env['myschool.sys.event'].create([{
+                'eventcode': code,
+                'status': 'NEW',
+                'syseventtype_id': event_type.id,
+                'priority': '3',  # Low priority for general events
+                'data': data,
+                'source': source,
+            } for code, data in events])
+            
+            if log_to_screen:
+                for event in created:
+                    _logger.debug(f'SysEvent added: {event.syseventtype_id.name} - {event.data}')
+            _logger.info(f'SysEvents created: {len(created)} events')
+            
+            return created
+            
+        except Exception as e:
+            _logger.exception("Error creating sys events")
+            self.create_sys_error(
+                'SYSEVENT-900',
+                f'Error creating {len(events)} events: {str(e)}',
+                'ERROR-NONBLOCKING',
+                log_to_screen=True
+            )
+            return self.env['myschool.sys.event']
+    
     @api.model
     def create_sys_error(self, code, data, error_type='ERROR-NONBLOCKING', log_to_screen=False, source='BE'):
         """